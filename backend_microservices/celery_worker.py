@@ -1,5 +1,17 @@
 #!/usr/bin/env python3
+# gevent has to patch sockets before celery, redis or smtplib are imported
+from gevent import monkey
+monkey.patch_all()
+
 from app.celery_tasks import celery_app
 
+# Notification tasks spend nearly all their time waiting on FCM/SMTP/Supabase,
+# so one gevent worker keeps hundreds in flight. Prefetch is uncapped and tasks
+# are acknowledged only after they finish.
+celery_app.conf.update(
+    worker_prefetch_multiplier=0,
+    task_acks_late=True
+)
+
 if __name__ == '__main__':
-    celery_app.start()
\ No newline at end of file
+    celery_app.worker_main(["worker", "--pool=gevent", "--concurrency=200", "--loglevel=info"])
\ No newline at end of file
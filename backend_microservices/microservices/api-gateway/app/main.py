@@ -1,17 +1,15 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import sys
-import os
 import logging
+import importlib
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
+from responses import ORJSONResponse
 
 app = FastAPI(
     title="Blinkit Clone - API Gateway",
     description="Microservices API Gateway",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Import config with fallback
@@ -24,9 +22,8 @@ except Exception as e:
 
 # Security middleware with fallback
 try:
-    from middleware.security import SecurityHeadersMiddleware, RateLimitMiddleware
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(RateLimitMiddleware, requests_per_minute=100)
+    from middleware.security import GatewayMiddleware
+    app.add_middleware(GatewayMiddleware, requests_per_minute=100)
     print("✓ Security middleware loaded")
 except ImportError:
     from starlette.middleware.base import BaseHTTPMiddleware
@@ -71,54 +68,23 @@ async def get_metrics():
 routes_loaded = []
 routes_failed = []
 
-try:
-    from .routes.auth import router as auth_router
-    app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
-    routes_loaded.append("auth")
-except Exception as e:
-    routes_failed.append(f"auth: {e}")
-
-try:
-    from .routes.products import router as products_router
-    app.include_router(products_router, prefix="/products", tags=["Products"])
-    routes_loaded.append("products")
-except Exception as e:
-    routes_failed.append(f"products: {e}")
-
-try:
-    from .routes.cart import router as cart_router
-    app.include_router(cart_router, prefix="/cart", tags=["Cart"])
-    routes_loaded.append("cart")
-except Exception as e:
-    routes_failed.append(f"cart: {e}")
-
-try:
-    from .routes.orders import router as orders_router
-    app.include_router(orders_router, prefix="/orders", tags=["Orders"])
-    routes_loaded.append("orders")
-except Exception as e:
-    routes_failed.append(f"orders: {e}")
-
-try:
-    from .routes.delivery import router as delivery_router
-    app.include_router(delivery_router, prefix="/delivery", tags=["Delivery"])
-    routes_loaded.append("delivery")
-except Exception as e:
-    routes_failed.append(f"delivery: {e}")
-
-try:
-    from .routes.notifications import router as notifications_router
-    app.include_router(notifications_router, prefix="/notifications", tags=["Notifications"])
-    routes_loaded.append("notifications")
-except Exception as e:
-    routes_failed.append(f"notifications: {e}")
+GATEWAY_ROUTES = (
+    ("auth", "/auth", "Authentication"),
+    ("products", "/products", "Products"),
+    ("cart", "/cart", "Cart"),
+    ("orders", "/orders", "Orders"),
+    ("delivery", "/delivery", "Delivery"),
+    ("notifications", "/notifications", "Notifications"),
+    ("admin", "/admin", "Admin"),
+)
 
-try:
-    from .routes.admin import router as admin_router
-    app.include_router(admin_router, prefix="/admin", tags=["Admin"])
-    routes_loaded.append("admin")
-except Exception as e:
-    routes_failed.append(f"admin: {e}")
+for module_name, prefix, tag in GATEWAY_ROUTES:
+    try:
+        module = importlib.import_module(f".routes.{module_name}", __package__)
+        app.include_router(module.router, prefix=prefix, tags=[tag])
+        routes_loaded.append(module_name)
+    except Exception as e:
+        routes_failed.append(f"{module_name}: {e}")
 
 print(f"✓ Routes loaded: {routes_loaded}")
 if routes_failed:
@@ -141,7 +107,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -1,11 +1,6 @@
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-import sys
-import os
-
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 
 # Import AuthClient from shared auth module
 try:
@@ -50,15 +45,16 @@ class AuthMiddleware(BaseHTTPMiddleware):
             "/products/"
         }
         
-        # Routes that require authentication
-        self.protected_prefixes = {
+        # Routes that require authentication, as a tuple so str.startswith
+        # checks them all in one call
+        self.protected_prefixes = (
             "/auth/me",
             "/cart/",
             "/orders/",
             "/delivery/",
             "/notifications/",
             "/admin/"
-        }
+        )
     
     def _is_public_route(self, path: str) -> bool:
         """Check if route is public (doesn't require auth)"""
@@ -67,14 +63,14 @@ class AuthMiddleware(BaseHTTPMiddleware):
             return True
         
         # Check if it's a GET request to products (public browsing)
-        if path.startswith("/products/") and not any(path.startswith(prefix) for prefix in self.protected_prefixes):
+        if path.startswith("/products/") and not path.startswith(self.protected_prefixes):
             return True
             
         return False
     
     def _requires_auth(self, path: str) -> bool:
         """Check if route requires authentication"""
-        return any(path.startswith(prefix) for prefix in self.protected_prefixes)
+        return path.startswith(self.protected_prefixes)
     
     async def dispatch(self, request: Request, call_next):
         path = request.url.path
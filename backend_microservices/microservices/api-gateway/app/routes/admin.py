@@ -1,15 +1,97 @@
-from fastapi import APIRouter, Request, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Query, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+import redis.asyncio as aioredis
 import httpx
+import asyncio
+import hmac
+import logging
+import orjson
 from ..config import settings
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+async def verify_admin(admin_key: str = Query(...)):
+    """Reject admin requests without the configured key"""
+    # Constant-time comparison so response timing reveals nothing about the key
+    if not hmac.compare_digest(admin_key.encode(), settings.admin_api_key.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin key")
+
+# Declared once on the router so every admin route shares the same check
+router = APIRouter(dependencies=[Depends(verify_admin)])
+
+# Admin stats are global and change over minutes, so dashboard polls are
+# served from Redis for a short window
+ADMIN_CACHE_PREFIX = "grofast-cache:"
+ADMIN_STATS_TTL_SECONDS = 60
+ADMIN_DASHBOARD_TTL_SECONDS = 300
+ADMIN_USER_SEARCH_TTL_SECONDS = 10
+
+_redis_client = None
+# Pooled client for streamed relays, so no per-request client has to be closed
+_http_client = None
+
+def get_redis() -> aioredis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(settings.redis_url)
+    return _redis_client
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient()
+    return _http_client
 
 @router.get("/stats")
-async def get_admin_stats(admin_key: str = Query(...)):
-    if admin_key != "admin123":
-        return {"error": "Invalid admin key"}
+async def get_admin_stats():
+    cache_key = f"{ADMIN_CACHE_PREFIX}admin:stats"
+    try:
+        cached = await get_redis().get(cache_key)
+        if cached:
+            return orjson.loads(cached)
+    except Exception as e:
+        logger.debug(f"Admin stats cache unavailable: {e}")
+    
+    stats = await _collect_admin_stats()
     
-    # Aggregate stats from multiple services
+    # Partial results are not cached so a recovered service shows up immediately
+    if "error" not in stats:
+        try:
+            await get_redis().set(cache_key, orjson.dumps(stats), ex=ADMIN_STATS_TTL_SECONDS)
+        except Exception as e:
+            logger.debug(f"Failed to cache admin stats: {e}")
+    
+    return stats
+
+@router.get("/analytics/dashboard")
+async def get_dashboard_analytics(days: int = Query(30, ge=1, le=365)):
+    cache_key = f"{ADMIN_CACHE_PREFIX}admin:dashboard:{days}"
+    try:
+        cached = await get_redis().get(cache_key)
+        if cached:
+            return orjson.loads(cached)
+    except Exception as e:
+        logger.debug(f"Dashboard analytics cache unavailable: {e}")
+    
+    async with httpx.AsyncClient() as client:
+        response = await client.get(
+            f"{settings.order_service_url}/internal/analytics",
+            params={"days": days}
+        )
+    if response.status_code != 200:
+        return {"error": f"Order service returned HTTP {response.status_code}"}
+    
+    analytics = response.json()
+    try:
+        await get_redis().set(cache_key, orjson.dumps(analytics), ex=ADMIN_DASHBOARD_TTL_SECONDS)
+    except Exception as e:
+        logger.debug(f"Failed to cache dashboard analytics: {e}")
+    
+    return analytics
+
+async def _collect_admin_stats() -> dict:
+    """Aggregate stats from the auth, order and delivery services"""
     stats = {
         "total_users": 0,
         "total_orders": 0,
@@ -17,46 +99,61 @@ async def get_admin_stats(admin_key: str = Query(...)):
         "active_delivery_partners": 0
     }
     
-    try:
-        async with httpx.AsyncClient() as client:
-            # Get user stats from Auth Service
-            auth_response = await client.get(f"{settings.auth_service_url}/internal/stats")
-            if auth_response.status_code == 200:
-                auth_stats = auth_response.json()
-                stats["total_users"] = auth_stats.get("total_users", 0)
-            
-            # Get order stats from Order Service
-            order_response = await client.get(f"{settings.order_service_url}/internal/stats")
-            if order_response.status_code == 200:
-                order_stats = order_response.json()
-                stats["total_orders"] = order_stats.get("total_orders", 0)
-                stats["total_revenue"] = order_stats.get("total_revenue", 0.0)
-            
-            # Get delivery stats from Delivery Service
-            delivery_response = await client.get(f"{settings.delivery_service_url}/internal/stats")
-            if delivery_response.status_code == 200:
-                delivery_stats = delivery_response.json()
-                stats["active_delivery_partners"] = delivery_stats.get("active_partners", 0)
+    async with httpx.AsyncClient() as client:
+        # The three services are independent, so query them concurrently
+        auth_response, order_response, delivery_response = await asyncio.gather(
+            client.get(f"{settings.auth_service_url}/internal/stats"),
+            client.get(f"{settings.order_service_url}/internal/stats"),
+            client.get(f"{settings.delivery_service_url}/internal/stats"),
+            return_exceptions=True
+        )
     
-    except Exception as e:
-        stats["error"] = f"Failed to fetch stats: {str(e)}"
+    errors = [
+        str(response) for response in (auth_response, order_response, delivery_response)
+        if isinstance(response, Exception)
+    ]
+    if errors:
+        stats["error"] = f"Failed to fetch stats: {'; '.join(errors)}"
+    
+    # Get user stats from Auth Service
+    if isinstance(auth_response, httpx.Response) and auth_response.status_code == 200:
+        auth_stats = auth_response.json()
+        stats["total_users"] = auth_stats.get("total_users", 0)
+    
+    # Get order stats from Order Service
+    if isinstance(order_response, httpx.Response) and order_response.status_code == 200:
+        order_stats = order_response.json()
+        stats["total_orders"] = order_stats.get("total_orders", 0)
+        stats["total_revenue"] = order_stats.get("total_revenue", 0.0)
+        stats["orders_by_status"] = order_stats.get("orders_by_status", {})
+    
+    # Get delivery stats from Delivery Service
+    if isinstance(delivery_response, httpx.Response) and delivery_response.status_code == 200:
+        delivery_stats = delivery_response.json()
+        stats["active_delivery_partners"] = delivery_stats.get("active_partners", 0)
     
     return stats
 
 @router.get("/products")
-async def get_admin_products(admin_key: str = Query(...)):
-    if admin_key != "admin123":
-        return {"error": "Invalid admin key"}
+async def get_admin_products(request: Request):
+    params = {k: v for k, v in request.query_params.items() if k != "admin_key"}
+    client = get_http_client()
+    upstream = await client.send(
+        client.build_request("GET", f"{settings.product_service_url}/admin/products", params=params),
+        stream=True
+    )
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{settings.product_service_url}/admin/products")
-        return response.json()
+    # Relay bytes as they arrive so NDJSON product exports are never buffered here
+    return StreamingResponse(
+        upstream.aiter_bytes(),
+        status_code=upstream.status_code,
+        media_type=upstream.headers.get("content-type"),
+        # Releases the pooled connection once the body has been relayed
+        background=BackgroundTask(upstream.aclose)
+    )
 
 @router.post("/products")
-async def create_admin_product(request: Request, admin_key: str = Query(...)):
-    if admin_key != "admin123":
-        return {"error": "Invalid admin key"}
-    
+async def create_admin_product(request: Request):
     body = await request.body()
     async with httpx.AsyncClient() as client:
         response = await client.post(
@@ -66,11 +163,58 @@ async def create_admin_product(request: Request, admin_key: str = Query(...)):
         )
         return response.json()
 
+@router.put("/products/bulk")
+async def bulk_update_admin_products(request: Request):
+    body = await request.body()
+    async with httpx.AsyncClient() as client:
+        response = await client.put(
+            f"{settings.product_service_url}/admin/products/bulk",
+            content=body,
+            headers={"content-type": "application/json"}
+        )
+        return response.json()
+
+@router.post("/products/{product_id}/restock")
+async def restock_admin_product(product_id: int, request: Request):
+    body = await request.body()
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            f"{settings.product_service_url}/admin/products/{product_id}/restock",
+            content=body,
+            headers={"content-type": "application/json"}
+        )
+        return response.json()
+
 @router.get("/orders")
-async def get_admin_orders(admin_key: str = Query(...)):
-    if admin_key != "admin123":
-        return {"error": "Invalid admin key"}
+async def get_admin_orders(request: Request):
+    # Pagination cursor (limit, after_created_at, after_id) is passed through as-is
+    params = {k: v for k, v in request.query_params.items() if k != "admin_key"}
+    async with httpx.AsyncClient() as client:
+        response = await client.get(f"{settings.order_service_url}/admin/orders", params=params)
+        return response.json()
+
+@router.get("/users")
+async def get_admin_users(request: Request):
+    params = {k: v for k, v in request.query_params.items() if k != "admin_key"}
+    
+    # Searches are typed keystroke by keystroke, so repeats are served from Redis briefly
+    cache_key = None
+    if params.get("search"):
+        cache_key = f"{ADMIN_CACHE_PREFIX}admin:users:" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        try:
+            cached = await get_redis().get(cache_key)
+            if cached:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.debug(f"Admin user search cache unavailable: {e}")
     
     async with httpx.AsyncClient() as client:
-        response = await client.get(f"{settings.order_service_url}/admin/orders")
-        return response.json()
\ No newline at end of file
+        response = await client.get(f"{settings.auth_service_url}/admin/users", params=params)
+    
+    if cache_key and response.status_code == 200:
+        try:
+            await get_redis().set(cache_key, response.content, ex=ADMIN_USER_SEARCH_TTL_SECONDS)
+        except Exception as e:
+            logger.debug(f"Failed to cache admin user search: {e}")
+    
+    return response.json()
\ No newline at end of file
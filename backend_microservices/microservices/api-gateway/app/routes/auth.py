@@ -1,12 +1,6 @@
 from fastapi import APIRouter, Request
-import sys
-import os
 import json
 
-# Add shared modules to path
-shared_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared')
-sys.path.append(shared_path)
-
 from http_client import ResilientHttpClient
 from custom_circuit_breaker import CircuitBreaker, RetryConfig, CircuitBreakerError
 from ..config import settings
@@ -1,10 +1,4 @@
 from fastapi import APIRouter, Request
-import sys
-import os
-
-# Add shared modules to path
-shared_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared')
-sys.path.append(shared_path)
 
 from http_client import ResilientHttpClient
 from custom_circuit_breaker import CircuitBreaker, RetryConfig, CircuitBreakerError
@@ -2,7 +2,6 @@ import sys
 import os
 import logging
 from typing import List, Dict, Any, Optional
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
 
 from shared_config import BaseServiceSettings, ConfigurationError
 
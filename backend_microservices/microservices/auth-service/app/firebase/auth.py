@@ -7,6 +7,7 @@ import firebase_admin
 from firebase_admin import credentials, auth
 from fastapi import HTTPException, status
 from typing import Dict, Any, Optional
+import redis.asyncio as aioredis
 import os
 import json
 import logging
@@ -16,6 +17,7 @@ logger = logging.getLogger(__name__)
 class FirebaseAuth:
     _app = None
     _initialized = False
+    _redis = None
     
     @classmethod
     def initialize(cls):
@@ -137,6 +139,16 @@ class FirebaseAuth:
                 detail="Authentication failed"
             )
     
+    @classmethod
+    def get_redis(cls) -> aioredis.Redis:
+        """Get the shared Redis client used for AuthService's token cache and sessions"""
+        if cls._redis is None:
+            cls._redis = aioredis.from_url(
+                os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+                decode_responses=True
+            )
+        return cls._redis
+    
     @classmethod
     def verify_google_token(cls, token: str) -> Dict[str, Any]:
         """
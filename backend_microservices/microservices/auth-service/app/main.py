@@ -1,22 +1,19 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routes import auth, internal
+from .routes import auth, internal, admin
 from .config import settings
 from .database import db_manager
-import sys
-import os
-
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
 
 from custom_logging import setup_logging
+from responses import ORJSONResponse
 from health_checks import HealthChecker, create_fastapi_health_endpoints
 from startup_validation import create_startup_event_handler
 
 app = FastAPI(
     title="Auth Service",
     description="Authentication and User Management Service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Setup logging
@@ -56,4 +53,5 @@ app.add_middleware(
 
 # Include routers
 app.include_router(auth.router, tags=["Authentication"])
-app.include_router(internal.router, prefix="/internal", tags=["Internal"])
\ No newline at end of file
+app.include_router(internal.router, prefix="/internal", tags=["Internal"])
+app.include_router(admin.router, prefix="/admin", tags=["Admin"])
\ No newline at end of file
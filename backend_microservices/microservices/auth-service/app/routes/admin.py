@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, tuple_, func, or_
+from datetime import datetime
+from typing import List, Optional
+from pydantic import TypeAdapter
+from ..database import get_db
+from ..models.user import User
+from ..schemas.user import UserResponse
+
+from custom_logging import setup_logging
+
+logger = setup_logging("auth-service-admin", log_level="INFO")
+
+router = APIRouter()
+
+# Validates a page of ORM rows in a single call
+USER_LIST = TypeAdapter(List[UserResponse])
+
+# Shorter terms match too many trigrams for the GIN index to narrow anything down
+MIN_SEARCH_LENGTH = 3
+
+# Must match the idx_users_search_trgm expression exactly for the planner to use it
+USER_SEARCH_TEXT = (
+    func.coalesce(User.name, '') + ' ' + func.coalesce(User.email, '') + ' ' + func.coalesce(User.phone, '')
+)
+
+def _escape_like(term: str) -> str:
+    """Match LIKE wildcards in user input literally, so '___' cannot match every row"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+@router.get("/users")
+async def get_all_users(
+    limit: int = Query(50, ge=1, le=100),
+    after_created_at: Optional[datetime] = Query(None, description="created_at of the last user on the previous page"),
+    after_id: Optional[int] = Query(None, description="id of the last user on the previous page"),
+    search: Optional[str] = Query(None, description="Match against name, email or phone"),
+    db: AsyncSession = Depends(get_db)
+):
+    """List users newest first using keyset pagination on (created_at, id)"""
+    query = select(User).order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+    
+    if search:
+        if len(search) < MIN_SEARCH_LENGTH:
+            raise HTTPException(status_code=400, detail=f"Search must be at least {MIN_SEARCH_LENGTH} characters")
+        query = query.where(USER_SEARCH_TEXT.ilike(f"%{_escape_like(search)}%", escape="\\"))
+    
+    # Seek past the previous page through idx_users_created_id instead of OFFSET
+    if after_created_at is not None and after_id is not None:
+        query = query.where(tuple_(User.created_at, User.id) < tuple_(after_created_at, after_id))
+    
+    result = await db.execute(query)
+    users = result.scalars().all()
+    
+    next_cursor = None
+    if len(users) == limit:
+        last = users[-1]
+        next_cursor = {"after_created_at": last.created_at.isoformat(), "after_id": last.id}
+    
+    logger.info(f"Admin user page returned {len(users)} users")
+    return {
+        "users": USER_LIST.validate_python(users, from_attributes=True),
+        "next_cursor": next_cursor
+    }
@@ -1,19 +1,25 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..database import get_db
+from ..models.user import User
 from ..schemas.user import OTPVerifyRequest, GoogleLoginRequest, UserResponse, UserUpdate
 from ..services.auth_service import AuthService
-import sys
-import os
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 from custom_logging import setup_logging
 
 logger = setup_logging("auth-service", log_level="INFO")
 
 router = APIRouter()
 
+async def get_token_user(
+    firebase_token: str,
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Resolve the caller once per request; repeat tokens are served from the Redis token cache"""
+    logger.info(f"Resolving user for token: {firebase_token[:10]}...")
+    return await AuthService.create_or_get_user(db, firebase_token)
+
 @router.post("/verify-otp", response_model=UserResponse)
 async def verify_otp(
     request: OTPVerifyRequest,
@@ -25,24 +31,17 @@ async def verify_otp(
     return UserResponse.model_validate(user)
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user(
-    firebase_token: str,
-    db: AsyncSession = Depends(get_db)
-):
+async def get_current_user(user: User = Depends(get_token_user)):
     """Get current user info"""
-    logger.info(f"Get current user request for token: {firebase_token[:10]}...")
-    user = await AuthService.create_or_get_user(db, firebase_token)
     return UserResponse.model_validate(user)
 
 @router.put("/me", response_model=UserResponse)
 async def update_current_user(
     user_update: UserUpdate,
-    firebase_token: str,
+    user: User = Depends(get_token_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Update current user info"""
-    logger.info(f"Update user request for token: {firebase_token[:10]}...")
-    user = await AuthService.create_or_get_user(db, firebase_token)
     updated_user = await AuthService.update_user(db, user.id, user_update)
     return UserResponse.model_validate(updated_user)
 
@@ -65,7 +64,11 @@ async def logout_user(
     try:
         user = await AuthService.create_or_get_user(db, firebase_token)
         session_key = f"session:{user.id}:{firebase_token[-8:]}"
-        await AuthService.invalidate_session(session_key)
+        # Independent Redis writes that each handle their own failures, so they run concurrently
+        await asyncio.gather(
+            AuthService.invalidate_session(session_key),
+            AuthService.forget_token(firebase_token)
+        )
         logger.info(f"User {user.id} logged out successfully")
         return {"message": "Logged out successfully"}
     except HTTPException:
@@ -1,19 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, bindparam
 from pydantic import BaseModel
 from ..database import get_db
+from ..models.user import User
 from ..services.auth_service import AuthService
-import sys
-import os
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 from custom_logging import setup_logging
 
 logger = setup_logging("auth-service-internal", log_level="INFO")
 
 router = APIRouter()
 
+# Only the columns a broadcast needs, as plain rows rather than ORM objects. Pages are
+# keyed on the primary key, so each one is a short index range scan and no connection
+# or transaction is held while the caller sends to the previous page.
+ACTIVE_USER_CONTACTS_PAGE = select(
+    User.id, User.fcm_token, User.email, User.phone
+).where(
+    User.is_active == True, User.id > bindparam("after_id")
+).order_by(User.id).limit(bindparam("limit"))
+
 class TokenVerifyRequest(BaseModel):
     token: str
 
@@ -36,6 +43,20 @@ async def verify_token(
         logger.error(f"Token verification failed: {e}")
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# Declared before /users/{user_id} so the literal path is not captured as a user id
+@router.get("/users/active-contacts")
+async def get_active_user_contacts(
+    after_id: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db)
+):
+    """One page of active users' contact details, ordered by id after the given cursor"""
+    result = await db.execute(ACTIVE_USER_CONTACTS_PAGE, {"after_id": after_id, "limit": limit})
+    users = [row._asdict() for row in result]
+    # A short page is the last one; otherwise the caller continues after its final id
+    next_after_id = users[-1]["id"] if len(users) == limit else None
+    return {"users": users, "next_after_id": next_after_id}
+
 @router.get("/users/{user_id}")
 async def get_user_info(
     user_id: int,
@@ -60,4 +81,4 @@ async def get_user_info(
         raise
     except Exception as e:
         logger.error(f"Failed to get user info: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Internal server error")
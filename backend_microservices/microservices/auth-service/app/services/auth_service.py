@@ -1,8 +1,48 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from ..models.user import User
 from ..schemas.user import UserCreate, UserUpdate
+from ..firebase.auth import FirebaseAuth
 from fastapi import HTTPException, status
+from cachetools import TTLCache
+import hashlib
+import logging
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Token -> user mapping, so repeat requests skip verification and the UID lookup
+USER_TOKEN_CACHE_PREFIX = "tok:"
+# Fixed TTL: tokens are resolved through the mock UID path and carry no exp claim to cap it
+USER_TOKEN_CACHE_TTL = 3600
+
+# firebase_uid -> user id for hot users; ids never change, so nothing needs invalidating
+USER_ID_LOCAL_CACHE_SIZE = 10000
+USER_ID_LOCAL_CACHE_TTL = 60
+_user_ids_by_uid = TTLCache(maxsize=USER_ID_LOCAL_CACHE_SIZE, ttl=USER_ID_LOCAL_CACHE_TTL)
+
+# Each user's live session keys are indexed in a set, so per-user lookups never scan the keyspace
+SESSION_PREFIX = "session:"
+USER_SESSIONS_PREFIX = "user_sessions:"
+SESSION_TTL_SECONDS = 3600
+
+# Unlinks every session in a user's index and the index itself in one atomic round trip
+INVALIDATE_USER_SESSIONS_LUA = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+if #keys > 0 then
+    redis.call('UNLINK', unpack(keys))
+end
+redis.call('UNLINK', KEYS[1])
+return #keys
+"""
+_invalidate_user_sessions_script = None
+
+def _user_token_cache_key(firebase_token: str) -> str:
+    return USER_TOKEN_CACHE_PREFIX + hashlib.sha256(firebase_token.encode()).hexdigest()[:24]
+
+def _user_sessions_key(user_id: int) -> str:
+    return f"{USER_SESSIONS_PREFIX}{user_id}"
 
 class AuthService:
     @staticmethod
@@ -11,11 +51,39 @@ class AuthService:
         if not firebase_token or len(firebase_token) < 10:
             raise HTTPException(status_code=401, detail="Invalid token")
         
+        redis_client = FirebaseAuth.get_redis()
+        cache_key = _user_token_cache_key(firebase_token)
+        
+        try:
+            cached = await redis_client.get(cache_key)
+            if cached:
+                user = await db.get(User, orjson.loads(cached)['user_id'])
+                if user:
+                    return user
+        except Exception as e:
+            logger.debug(f"User token cache lookup failed: {e}")
+        
+        user = await AuthService._lookup_user(db, firebase_token)
+        
+        try:
+            entry = {'user_id': user.id, 'uid': user.firebase_uid}
+            await redis_client.set(cache_key, orjson.dumps(entry), ex=USER_TOKEN_CACHE_TTL)
+        except Exception as e:
+            logger.debug(f"User token cache store failed: {e}")
+        
+        return user
+    
+    @staticmethod
+    async def _lookup_user(db: AsyncSession, firebase_token: str) -> User:
         # Extract mock UID from token (last 8 chars)
         mock_uid = f"firebase_{firebase_token[-8:]}"
         
-        result = await db.execute(select(User).where(User.firebase_uid == mock_uid))
-        user = result.scalar_one_or_none()
+        # A known UID resolves through the primary key instead of the firebase_uid index
+        user_id = _user_ids_by_uid.get(mock_uid)
+        user = await db.get(User, user_id) if user_id is not None else None
+        if not user:
+            result = await db.execute(select(User).where(User.firebase_uid == mock_uid))
+            user = result.scalar_one_or_none()
         
         if not user:
             user_data = UserCreate(
@@ -23,26 +91,39 @@ class AuthService:
                 email="demo@example.com",
                 name="Demo User"
             )
-            user = User(**user_data.model_dump())
-            db.add(user)
+            # One statement creates the row; a concurrent first login for the same UID
+            # inserts nothing here and reads the winner's row instead of failing
+            result = await db.execute(
+                insert(User)
+                .values(**user_data.model_dump())
+                .on_conflict_do_nothing(index_elements=[User.firebase_uid])
+                .returning(User)
+            )
+            user = result.scalar_one_or_none()
             await db.commit()
-            await db.refresh(user)
+            if not user:
+                result = await db.execute(select(User).where(User.firebase_uid == mock_uid))
+                user = result.scalar_one()
         
+        _user_ids_by_uid[mock_uid] = user.id
         return user
     
     @staticmethod
     async def update_user(db: AsyncSession, user_id: int, user_update: UserUpdate) -> User:
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        values = user_update.model_dump(exclude_unset=True)
+        if values:
+            # One UPDATE ... RETURNING instead of a SELECT, a flush and a refresh
+            result = await db.execute(
+                update(User).where(User.id == user_id).values(**values).returning(User)
+            )
+            user = result.scalar_one_or_none()
+        else:
+            user = await db.get(User, user_id)
         
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        for field, value in user_update.model_dump(exclude_unset=True).items():
-            setattr(user, field, value)
-        
         await db.commit()
-        await db.refresh(user)
         return user
     
     @staticmethod
@@ -55,12 +136,49 @@ class AuthService:
         result = await db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def forget_token(firebase_token: str):
+        """Drop the cached user mapping for a token"""
+        try:
+            await FirebaseAuth.get_redis().delete(_user_token_cache_key(firebase_token))
+        except Exception as e:
+            logger.debug(f"User token cache delete failed: {e}")
+    
     @staticmethod
     async def invalidate_session(session_key: str):
-        # Mock session invalidation
-        pass
+        user_id = session_key.split(":")[1]
+        try:
+            async with FirebaseAuth.get_redis().pipeline(transaction=False) as pipe:
+                pipe.delete(session_key)
+                pipe.srem(_user_sessions_key(user_id), session_key)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Session invalidation failed for {session_key}: {e}")
+    
+    @staticmethod
+    async def invalidate_all_user_sessions(user_id: int):
+        """Drop every session of a user using the per-user index instead of a KEYS scan"""
+        global _invalidate_user_sessions_script
+        try:
+            if _invalidate_user_sessions_script is None:
+                _invalidate_user_sessions_script = FirebaseAuth.get_redis().register_script(
+                    INVALIDATE_USER_SESSIONS_LUA
+                )
+            await _invalidate_user_sessions_script(keys=[_user_sessions_key(user_id)])
+        except Exception as e:
+            logger.debug(f"Session invalidation failed for user {user_id}: {e}")
     
     @staticmethod
     async def create_user_session(user_id: int, firebase_token: str) -> str:
-        # Mock session creation
-        return f"session:{user_id}:{firebase_token[-8:]}"
\ No newline at end of file
+        session_key = f"{SESSION_PREFIX}{user_id}:{firebase_token[-8:]}"
+        index_key = _user_sessions_key(user_id)
+        try:
+            async with FirebaseAuth.get_redis().pipeline(transaction=False) as pipe:
+                pipe.set(session_key, user_id, ex=SESSION_TTL_SECONDS)
+                pipe.sadd(index_key, session_key)
+                # Refreshed with every new session so the index expires with the newest one
+                pipe.expire(index_key, SESSION_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Session creation failed for user {user_id}: {e}")
+        return session_key
\ No newline at end of file
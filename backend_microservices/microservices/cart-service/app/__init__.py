@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Register the shared modules directory once for the whole service
+SHARED_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
+if SHARED_PATH not in sys.path:
+    sys.path.append(SHARED_PATH)
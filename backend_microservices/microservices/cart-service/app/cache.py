@@ -0,0 +1,35 @@
+import redis.asyncio as aioredis
+import logging
+from typing import Optional
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rendered cart bodies, written through on every mutation so the next read is a hit
+CART_CACHE_PREFIX = "cart:user:"
+CART_CACHE_TTL_SECONDS = 300
+
+_redis_client = None
+
+def get_redis() -> aioredis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(settings.redis_url)
+    return _redis_client
+
+def cart_cache_key(user_id: int) -> str:
+    return f"{CART_CACHE_PREFIX}{user_id}:v1"
+
+async def get_cart(user_id: int) -> Optional[bytes]:
+    """Return the cached JSON body of a cart, or None on a miss or when Redis is unavailable"""
+    try:
+        return await get_redis().get(cart_cache_key(user_id))
+    except Exception as e:
+        logger.debug(f"Cart cache read failed for user {user_id}: {e}")
+    return None
+
+async def set_cart(user_id: int, body: bytes):
+    try:
+        await get_redis().set(cart_cache_key(user_id), body, ex=CART_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.debug(f"Cart cache write failed for user {user_id}: {e}")
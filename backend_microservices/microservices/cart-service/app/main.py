@@ -3,14 +3,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from .routes import cart
 from .config import settings
 from .database import db_manager
-import sys
-import os
 import logging
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
-
 from custom_logging import setup_logging
+from responses import ORJSONResponse
 from health_checks import HealthChecker, create_fastapi_health_endpoints
 from startup_validation import create_startup_event_handler
 
@@ -20,7 +16,8 @@ logger = setup_logging("cart-service", log_level="INFO")
 app = FastAPI(
     title="Cart Service",
     description="Shopping Cart Management Service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add startup validation
@@ -1,8 +1,5 @@
-import sys
-import os
 import logging
 from typing import List, Dict, Any
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
 
 from shared_config import BaseServiceSettings, ConfigurationError
 
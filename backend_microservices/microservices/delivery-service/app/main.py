@@ -3,20 +3,19 @@ from fastapi.middleware.cors import CORSMiddleware
 from .routes import delivery
 from .config import settings
 from .database import db_manager
-import sys
-import os
-
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
+from .services.delivery_service import DeliveryService
+import asyncio
 
 from custom_logging import setup_logging
+from responses import ORJSONResponse
 from health_checks import HealthChecker, create_fastapi_health_endpoints
 from startup_validation import create_startup_event_handler
 
 app = FastAPI(
     title="Delivery Service",
     description="Delivery Partner Management Service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Setup logging
@@ -28,6 +27,21 @@ app.add_event_handler(
     create_startup_event_handler("delivery-service", db_manager.get_db, settings)
 )
 
+# Background flush of buffered location pings to Supabase
+location_flusher = None
+
+async def start_location_flusher():
+    global location_flusher
+    location_flusher = asyncio.create_task(DeliveryService.run_location_flusher())
+
+async def stop_location_flusher():
+    if location_flusher:
+        location_flusher.cancel()
+
+app.add_event_handler("startup", start_location_flusher)
+app.add_event_handler("shutdown", stop_location_flusher)
+app.add_event_handler("shutdown", DeliveryService.close_clients)
+
 # Setup comprehensive health checks
 health_checker = HealthChecker("delivery-service", logger)
 
@@ -1,5 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Enum, Boolean
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Enum, Boolean, Float, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func, text
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
 import enum
 from ..database import Base
 
@@ -14,17 +18,30 @@ class DeliveryPartner(Base):
     firebase_uid = Column(String(128), unique=True, nullable=False)
     name = Column(String(100), nullable=False)
     phone = Column(String(15), unique=True, nullable=False)
-    status = Column(Enum(DeliveryStatus), default=DeliveryStatus.OFFLINE)
-    current_latitude = Column(String(20))
-    current_longitude = Column(String(20))
+    status = Column(
+        Enum(DeliveryStatus, name="delivery_status", values_callable=lambda e: [x.value for x in e]),
+        default=DeliveryStatus.OFFLINE
+    )
+    current_latitude = Column(Float)
+    current_longitude = Column(Float)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index('idx_dp_status_location', 'status', 'current_latitude', 'current_longitude'),
+        Index('idx_dp_firebase_uid_active', 'firebase_uid', 'is_active'),
+    )
 
 class DeliveryLocation(Base):
     __tablename__ = "delivery_locations"
-    id = Column(Integer, primary_key=True)
-    delivery_partner_id = Column(Integer, ForeignKey("delivery_partners.id"))
-    order_id = Column(Integer)
-    latitude = Column(Numeric(10,8), nullable=False)
-    longitude = Column(Numeric(11,8), nullable=False)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    id: Mapped[int] = mapped_column(primary_key=True)
+    delivery_partner_id: Mapped[Optional[int]] = mapped_column(ForeignKey("delivery_partners.id"))
+    order_id: Mapped[Optional[int]]
+    latitude: Mapped[Decimal] = mapped_column(Numeric(10,8))
+    longitude: Mapped[Decimal] = mapped_column(Numeric(11,8))
+    timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # Latest known location per partner
+        Index('idx_dl_partner_timestamp', 'delivery_partner_id', text('timestamp DESC')),
+    )
\ No newline at end of file
@@ -7,11 +7,7 @@ from ..schemas.delivery import (
     DeliveryPartnerResponse, LocationUpdate, DeliveryStatusUpdate, 
     DeliveryLocationResponse
 )
-import sys
-import os
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 from custom_logging import setup_logging
 
 logger = setup_logging("delivery-service", log_level="INFO")
@@ -52,16 +48,17 @@ async def update_delivery_status(
     """Update delivery partner status"""
     logger.info(f"Updating delivery partner {partner_id} status to {status_update.status}")
     result = await db.execute(
-        select(DeliveryPartner).where(DeliveryPartner.id == partner_id)
+        update(DeliveryPartner)
+        .where(DeliveryPartner.id == partner_id)
+        .values(status=status_update.status)
+        .returning(DeliveryPartner)
     )
     partner = result.scalar_one_or_none()
     
     if not partner:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Delivery partner not found")
     
-    partner.status = status_update.status
     await db.commit()
-    await db.refresh(partner)
     
     logger.info(f"Delivery partner {partner_id} status updated to {status_update.status}")
     return DeliveryPartnerResponse.model_validate(partner)
@@ -75,19 +72,18 @@ async def update_location(
     """Update delivery partner location"""
     logger.info(f"Updating location for delivery partner {partner_id}")
     
-    # Update partner's current location
+    # Update the partner's current location in place; RETURNING doubles as the existence check
     result = await db.execute(
-        select(DeliveryPartner).where(DeliveryPartner.id == partner_id)
+        update(DeliveryPartner)
+        .where(DeliveryPartner.id == partner_id)
+        .values(current_latitude=location.latitude, current_longitude=location.longitude)
+        .returning(DeliveryPartner.id)
     )
-    partner = result.scalar_one_or_none()
     
-    if not partner:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Delivery partner not found")
     
-    partner.current_latitude = str(location.latitude)
-    partner.current_longitude = str(location.longitude)
-    
-    # Create location record
+    # Create location record; the id and timestamp come back from INSERT ... RETURNING
     location_record = DeliveryLocation(
         delivery_partner_id=partner_id,
         order_id=location.order_id,
@@ -97,7 +93,6 @@ async def update_location(
     db.add(location_record)
     
     await db.commit()
-    await db.refresh(location_record)
     
     logger.info(f"Location updated for delivery partner {partner_id}")
     return DeliveryLocationResponse.model_validate(location_record)
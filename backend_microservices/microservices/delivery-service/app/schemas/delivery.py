@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -9,8 +9,8 @@ class DeliveryStatus(str, Enum):
     OFFLINE = "offline"
 
 class LocationUpdate(BaseModel):
-    latitude: float
-    longitude: float
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
     order_id: Optional[int] = None
 
 class DeliveryStatusUpdate(BaseModel):
@@ -22,12 +22,11 @@ class DeliveryPartnerResponse(BaseModel):
     phone: str
     email: Optional[str] = None
     status: DeliveryStatus
-    current_latitude: Optional[str] = None
-    current_longitude: Optional[str] = None
+    current_latitude: Optional[float] = None
+    current_longitude: Optional[float] = None
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class DeliveryLocationResponse(BaseModel):
     id: int
@@ -37,5 +36,4 @@ class DeliveryLocationResponse(BaseModel):
     longitude: float
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,24 +1,65 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from ..models.delivery import DeliveryPartner, DeliveryLocation, DeliveryStatus
-from supabase import create_client, Client
-import sys
-import os
-
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
+from ..config import settings
+import redis.asyncio as aioredis
+import asyncio
+import logging
+import httpx
+import orjson
 
 from http_client import ResilientHttpClient
-from circuit_breaker import CircuitBreaker, RetryConfig
+from custom_circuit_breaker import CircuitBreaker, RetryConfig
+
+logger = logging.getLogger(__name__)
+
+# Location pings are buffered in Redis and bulk-inserted into Supabase
+LOCATION_BUFFER_KEY = "loc:buf"
+LOCATION_FLUSH_BATCH = 1000
+LOCATION_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Firebase UID -> partner id, for read paths that only need the id
+PARTNER_ID_CACHE_PREFIX = "dp:uid:"
+PARTNER_ID_CACHE_TTL_SECONDS = 3600
 
 class DeliveryService:
     # Initialize resilient HTTP client for order service
     _order_client = None
+    # Keep-alive client for the Supabase REST API, shared across flushes
+    _supabase_client = None
+    _redis = None
+    
+    @classmethod
+    def get_supabase_client(cls) -> httpx.AsyncClient:
+        if cls._supabase_client is None:
+            cls._supabase_client = httpx.AsyncClient(
+                base_url=settings.supabase_url,
+                headers={
+                    "apikey": settings.supabase_key,
+                    "Authorization": f"Bearer {settings.supabase_key}",
+                    "Content-Type": "application/json",
+                    "Prefer": "return=minimal"
+                },
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=20)
+            )
+        return cls._supabase_client
+    
+    @classmethod
+    def get_redis(cls) -> aioredis.Redis:
+        if cls._redis is None:
+            cls._redis = aioredis.from_url(settings.redis_url)
+        return cls._redis
     
-    def __init__(self):
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_key = os.getenv('SUPABASE_KEY')
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+    @classmethod
+    async def close_clients(cls):
+        """Close pooled Supabase and Redis connections on shutdown"""
+        if cls._supabase_client is not None:
+            await cls._supabase_client.aclose()
+            cls._supabase_client = None
+        if cls._redis is not None:
+            await cls._redis.aclose()
+            cls._redis = None
     
     @classmethod
     def get_order_client(cls) -> ResilientHttpClient:
@@ -38,17 +79,42 @@ class DeliveryService:
         )
         return result.scalar_one_or_none()
     
+    @classmethod
+    async def get_delivery_partner_id(cls, db: AsyncSession, firebase_uid: str):
+        """Resolve a partner id from Redis, falling back to the database"""
+        cache_key = PARTNER_ID_CACHE_PREFIX + firebase_uid
+        try:
+            cached = await cls.get_redis().get(cache_key)
+            if cached:
+                return int(cached)
+        except Exception as e:
+            logger.debug(f"Partner id cache lookup failed: {e}")
+        
+        result = await db.execute(
+            select(DeliveryPartner.id).where(DeliveryPartner.firebase_uid == firebase_uid)
+        )
+        partner_id = result.scalar_one_or_none()
+        
+        if partner_id is not None:
+            try:
+                await cls.get_redis().set(cache_key, partner_id, ex=PARTNER_ID_CACHE_TTL_SECONDS)
+            except Exception as e:
+                logger.debug(f"Partner id cache store failed: {e}")
+        
+        return partner_id
+    
     @staticmethod
     async def update_status(db: AsyncSession, firebase_uid: str, status: DeliveryStatus):
         result = await db.execute(
-            select(DeliveryPartner).where(DeliveryPartner.firebase_uid == firebase_uid)
+            update(DeliveryPartner)
+            .where(DeliveryPartner.firebase_uid == firebase_uid)
+            .values(status=status)
+            .returning(DeliveryPartner)
         )
         partner = result.scalar_one_or_none()
         
         if partner:
-            partner.status = status
             await db.commit()
-            await db.refresh(partner)
         
         return partner
     
@@ -60,8 +126,8 @@ class DeliveryService:
         partner = result.scalar_one_or_none()
         
         if partner:
-            partner.current_latitude = str(latitude)
-            partner.current_longitude = str(longitude)
+            partner.current_latitude = latitude
+            partner.current_longitude = longitude
             
             # Save location history
             location = DeliveryLocation(
@@ -73,35 +139,29 @@ class DeliveryService:
             db.add(location)
             await db.commit()
             
-            # Update Supabase for real-time tracking
+            # Queue for the next bulk Supabase insert instead of one request per ping
             try:
-                self.supabase.table('delivery_locations').insert({
+                await DeliveryService.buffer_location({
                     'delivery_partner_id': partner.id,
                     'order_id': order_id,
                     'latitude': latitude,
                     'longitude': longitude
-                }).execute()
+                })
             except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Supabase update failed: {e}")
-                try:
-                    await db.rollback()
-                except:
-                    pass
+                logger.error(f"Failed to buffer location for Supabase: {e}")
         
         return partner
     
     @staticmethod
     async def get_assigned_orders(db: AsyncSession, firebase_uid: str):
-        partner = await DeliveryService.get_delivery_partner(db, firebase_uid)
-        if not partner:
+        partner_id = await DeliveryService.get_delivery_partner_id(db, firebase_uid)
+        if partner_id is None:
             return []
         
         # Get orders from Order Service using resilient client
         order_client = DeliveryService.get_order_client()
         try:
-            response = await order_client.get(f"/orders/assigned/{partner.id}")
+            response = await order_client.get(f"/orders/assigned/{partner_id}")
             if response.status_code == 200:
                 return response.json()
             else:
@@ -112,4 +172,43 @@ class DeliveryService:
             import logging
             logger = logging.getLogger(__name__)
             logger.warning(f"Failed to get assigned orders from Order Service: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    @classmethod
+    async def buffer_location(cls, location_data: dict):
+        """Queue a location ping for the next Supabase flush"""
+        await cls.get_redis().rpush(LOCATION_BUFFER_KEY, orjson.dumps(location_data))
+    
+    @classmethod
+    async def flush_location_buffer(cls) -> int:
+        """Send buffered location pings to Supabase in a single bulk insert"""
+        redis_client = cls.get_redis()
+        items = await redis_client.lpop(LOCATION_BUFFER_KEY, LOCATION_FLUSH_BATCH)
+        if not items:
+            return 0
+        
+        try:
+            # PostgREST inserts every row of a JSON array in one request
+            response = await cls.get_supabase_client().post(
+                "/rest/v1/delivery_locations",
+                content=b"[" + b",".join(items) + b"]"
+            )
+            response.raise_for_status()
+        except Exception:
+            # Put the batch back at the head of the buffer for the next flush
+            await redis_client.lpush(LOCATION_BUFFER_KEY, *reversed(items))
+            raise
+        
+        return len(items)
+    
+    @classmethod
+    async def run_location_flusher(cls):
+        """Flush the location buffer until cancelled"""
+        while True:
+            try:
+                flushed = await cls.flush_location_buffer()
+                if flushed:
+                    logger.debug(f"Flushed {flushed} locations to Supabase")
+            except Exception as e:
+                logger.error(f"Supabase location flush failed: {e}")
+            await asyncio.sleep(LOCATION_FLUSH_INTERVAL_SECONDS)
@@ -1,8 +1,6 @@
-import sys
 import os
 import logging
-from typing import List, Dict, Any
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
+from typing import List, Dict, Any, Optional
 
 from shared_config import BaseServiceSettings, ConfigurationError
 
@@ -14,6 +12,16 @@ class NotificationServiceSettings(BaseServiceSettings):
     # External service keys (Firebase Admin SDK replaces FCM server key)
     firebase_credentials_path: str
     resend_api_key: str
+    # Sender address for Resend (optional - email is mocked when not configured)
+    resend_from_email: Optional[str] = None
+    
+    # Twilio SMS (optional - SMS is mocked when not configured)
+    twilio_account_sid: Optional[str] = None
+    twilio_auth_token: Optional[str] = None
+    twilio_from_number: Optional[str] = None
+    
+    # Source of broadcast recipients
+    auth_service_url: str = "http://localhost:8001"
     
     # Notification-specific settings
     max_retry_attempts: int = 3
@@ -42,7 +50,12 @@ class NotificationServiceSettings(BaseServiceSettings):
             "retry_delay_seconds",
             "notification_batch_size",
             "email_rate_limit_per_hour",
-            "push_rate_limit_per_hour"
+            "push_rate_limit_per_hour",
+            "twilio_account_sid",
+            "twilio_auth_token",
+            "twilio_from_number",
+            "resend_from_email",
+            "auth_service_url"
         ]
         return base_vars + notification_vars
     
@@ -3,13 +3,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from .routes import notifications
 from .config import settings
 from .database import db_manager
-import sys
-import os
-
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
+from .services.notification_service import NotificationService
 
 from custom_logging import setup_logging
+from responses import ORJSONResponse
 from health_checks import HealthChecker, create_fastapi_health_endpoints
 from startup_validation import create_startup_event_handler
 
@@ -18,7 +15,8 @@ app = FastAPI(
     description="Push Notification and Email Service",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Setup logging
@@ -29,6 +27,7 @@ app.add_event_handler(
     "startup",
     create_startup_event_handler("notification-service", db_manager.get_db, settings)
 )
+app.add_event_handler("shutdown", NotificationService.close_clients)
 
 # Setup comprehensive health checks
 health_checker = HealthChecker("notification-service", logger)
@@ -1,18 +1,62 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-from ..services.notification_service import NotificationService
-import sys
-import os
+from typing import List, Dict, Any, NamedTuple, Optional
+import asyncio
+import collections
+import string
+import time
+import orjson
+import uuid
+from ..config import settings
+from ..services.notification_service import NotificationService, get_notification_service
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 from custom_logging import setup_logging
 
 logger = setup_logging("notification-service", log_level="INFO")
 
 router = APIRouter()
 
+# Upper bound on in-flight provider calls per request
+NOTIFICATION_CONCURRENCY = 64
+# Each channel of an order notification, retries included, finishes or is abandoned within this
+ORDER_NOTIFICATION_DEADLINE_SECONDS = 8
+
+# Broadcast progress is kept in Redis so any replica can report it
+BROADCAST_STATUS_PREFIX = "broadcast:"
+BROADCAST_STATUS_TTL_SECONDS = 86400
+BROADCAST_CHANNELS = ("fcm", "email", "sms")
+
+# Compiled once at import and shared by every order notification
+ORDER_UPDATE_EMAIL = string.Template("<h2>Order Update</h2><p>Your order #$order_id is $status</p>")
+
+# Push text per order status; plain str.format_map bodies, missing keys render empty
+ORDER_STATUS_PUSH = {
+    "pending": ("Order Placed", "Your order #{order_id} has been placed."),
+    "confirmed": ("Order Confirmed", "Your order #{order_id} has been confirmed."),
+    "preparing": ("Order Being Prepared", "Your order #{order_id} is being prepared."),
+    "out_for_delivery": ("Out for Delivery", "Your order #{order_id} is on its way."),
+    "delivered": ("Order Delivered", "Your order #{order_id} has been delivered."),
+    "cancelled": ("Order Cancelled", "Your order #{order_id} has been cancelled."),
+}
+ORDER_STATUS_PUSH_DEFAULT = ("Order {status_title}", "Your order #{order_id} is {status}")
+
+class OrderStatusContent(NamedTuple):
+    push_title: str
+    push_body: str
+    email_subject: str
+    email_html: str
+
+def order_status_content(order_id: int, order_status: str) -> OrderStatusContent:
+    """Text for an order status change, rendered once per request and shared by every channel"""
+    title, body = ORDER_STATUS_PUSH.get(order_status, ORDER_STATUS_PUSH_DEFAULT)
+    fields = collections.defaultdict(str, order_id=order_id, status=order_status, status_title=order_status.title())
+    return OrderStatusContent(
+        push_title=title.format_map(fields),
+        push_body=body.format_map(fields),
+        email_subject=f"Order Update - #{order_id}",
+        email_html=ORDER_UPDATE_EMAIL.substitute(order_id=order_id, status=order_status)
+    )
+
 class FCMNotificationRequest(BaseModel):
     fcm_tokens: List[str]
     title: str
@@ -28,6 +72,12 @@ class SMSRequest(BaseModel):
     phone: str
     message: str
 
+class BroadcastRequest(BaseModel):
+    title: str
+    body: str
+    data: Dict[str, Any] = {}
+    channels: List[str] = ["fcm"]
+
 class OrderNotificationRequest(BaseModel):
     user_id: int
     order_id: int
@@ -38,33 +88,48 @@ class OrderNotificationRequest(BaseModel):
     total_amount: Optional[float] = None
 
 @router.post("/fcm")
-async def send_fcm_notification(request: FCMNotificationRequest):
+async def send_fcm_notification(
+    request: FCMNotificationRequest,
+    service: NotificationService = Depends(get_notification_service)
+):
     """Send FCM push notification"""
     logger.info(f"Sending FCM notification to {len(request.fcm_tokens)} tokens")
-    service = NotificationService()
     
-    results = []
-    for token in request.fcm_tokens:
-        try:
-            success = await service.send_fcm_notification(
-                token, 
-                {"title": request.title, "body": request.body}, 
-                request.data
-            )
-            results.append({"token": token, "success": success})
-            logger.info(f"FCM notification sent to token: {token[:10]}...")
-        except Exception as e:
-            results.append({"token": token, "success": False, "error": str(e)})
-            logger.error(f"Failed to send FCM notification to {token[:10]}...: {e}")
+    # One multicast request per 500 tokens instead of one request per token
+    try:
+        sent = await service.send_fcm_multicast(
+            request.fcm_tokens,
+            {"title": request.title, "body": request.body},
+            request.data
+        )
+        results = [
+            {"token": token, "success": success}
+            for token, success in zip(request.fcm_tokens, sent)
+        ]
+    except Exception as e:
+        logger.error(f"FCM multicast to {len(request.fcm_tokens)} tokens failed: {e}")
+        results = [
+            {"token": token, "success": False, "error": str(e)}
+            for token in request.fcm_tokens
+        ]
+    
+    successful_sends = sum(result["success"] for result in results)
+    logger.info(f"FCM notifications sent: {successful_sends}/{len(results)}")
     
-    return {"message": "FCM notifications processed", "results": results}
+    return {
+        "message": "FCM notifications processed",
+        "successful": successful_sends,
+        "failed": len(results) - successful_sends,
+        "results": results
+    }
 
 @router.post("/email")
-async def send_email(request: EmailRequest):
+async def send_email(
+    request: EmailRequest,
+    service: NotificationService = Depends(get_notification_service)
+):
     """Send email notification"""
     logger.info(f"Sending email to: {request.to_email}")
-    service = NotificationService()
-    
     try:
         success = await service.send_email_notification(
             request.to_email,
@@ -78,11 +143,12 @@ async def send_email(request: EmailRequest):
         return {"message": "Email failed", "success": False, "error": str(e)}
 
 @router.post("/sms")
-async def send_sms(request: SMSRequest):
+async def send_sms(
+    request: SMSRequest,
+    service: NotificationService = Depends(get_notification_service)
+):
     """Send SMS notification"""
     logger.info(f"Sending SMS to: {request.phone}")
-    service = NotificationService()
-    
     try:
         success = await service.send_sms_notification(
             request.phone,
@@ -95,41 +161,160 @@ async def send_sms(request: SMSRequest):
         return {"message": "SMS failed", "success": False, "error": str(e)}
 
 @router.post("/order-status")
-async def send_order_notification(request: OrderNotificationRequest):
+async def send_order_notification(
+    request: OrderNotificationRequest,
+    service: NotificationService = Depends(get_notification_service)
+):
     """Send order status notification"""
     logger.info(f"Sending order notification for order {request.order_id} to user {request.user_id}")
-    service = NotificationService()
     
-    results = {}
+    content = order_status_content(request.order_id, request.status)
     
-    # Send FCM notification
+    # Channels are independent, so they are sent concurrently
+    sends = {}
     if request.fcm_token:
+        sends["fcm"] = service.send_fcm_notification(
+            request.fcm_token,
+            {"title": content.push_title, "body": content.push_body},
+            {"order_id": request.order_id, "status": request.status}
+        )
+    if request.email:
+        sends["email"] = service.send_email_notification(
+            request.email, content.email_subject, content.email_html
+        )
+    
+    results = {}
+    outcomes = await asyncio.gather(
+        *(asyncio.wait_for(send, ORDER_NOTIFICATION_DEADLINE_SECONDS) for send in sends.values()),
+        return_exceptions=True
+    )
+    for channel, outcome in zip(sends, outcomes):
+        if isinstance(outcome, Exception):
+            results[channel] = False
+            logger.error(f"{channel.upper()} notification failed: {outcome}")
+        else:
+            results[channel] = outcome
+    
+    logger.info(f"Order notification sent for order {request.order_id}")
+    return {"message": "Order notification sent", "results": results}
+
+async def _set_broadcast_status(task_id: str, status: str, **fields):
+    entry = {"task_id": task_id, "status": status, **fields}
+    await NotificationService.get_redis().set(
+        BROADCAST_STATUS_PREFIX + task_id, orjson.dumps(entry), ex=BROADCAST_STATUS_TTL_SECONDS
+    )
+
+async def run_broadcast(task_id: str, request: BroadcastRequest):
+    """Send a notification to every active user, fetching recipients a page at a time"""
+    logger.info(f"Broadcast {task_id}: sending '{request.title}' over {request.channels}")
+    # Recorded on every status write so a "running" entry left by a restarted replica can be spotted
+    started_at = int(time.time())
+    service = get_notification_service()
+    semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+    # Only running totals are kept so the status entry stays small for any audience size
+    counts = {channel: {"successful": 0, "failed": 0} for channel in request.channels}
+    
+    def record(channel: str, success: bool):
+        counts[channel]["successful" if success else "failed"] += 1
+    
+    async def send_fcm(tokens: List[str]):
         try:
-            fcm_success = await service.send_fcm_notification(
-                request.fcm_token,
-                {
-                    "title": f"Order {request.status.title()}",
-                    "body": f"Your order #{request.order_id} is {request.status}"
-                },
-                {"order_id": request.order_id, "status": request.status}
-            )
-            results["fcm"] = fcm_success
+            for success in await service.send_fcm_multicast(
+                tokens, {"title": request.title, "body": request.body}, request.data
+            ):
+                record("fcm", success)
         except Exception as e:
-            results["fcm"] = False
-            logger.error(f"FCM notification failed: {e}")
+            counts["fcm"]["failed"] += len(tokens)
+            logger.error(f"Broadcast FCM multicast failed: {e}")
     
-    # Send email notification
-    if request.email:
+    async def send_email(email: str):
+        async with semaphore:
+            try:
+                record("email", await service.send_email_notification(email, request.title, request.body))
+            except Exception as e:
+                record("email", False)
+                logger.error(f"Broadcast email failed: {e}")
+    
+    async def send_sms(phone: str):
+        async with semaphore:
+            try:
+                record("sms", await service.send_sms_notification(phone, request.body))
+            except Exception as e:
+                record("sms", False)
+                logger.error(f"Broadcast SMS failed: {e}")
+    
+    # Resolved once per broadcast instead of once per chunk
+    use_fcm, use_email, use_sms = "fcm" in counts, "email" in counts, "sms" in counts
+    
+    async def dispatch(chunk: List[Dict[str, Any]]):
+        # A single walk over the chunk collects the sends for every channel
+        tokens = []
+        sends = []
+        for user in chunk:
+            if use_fcm and user["fcm_token"]:
+                tokens.append(user["fcm_token"])
+            if use_email and user["email"]:
+                sends.append(send_email(user["email"]))
+            if use_sms and user["phone"]:
+                sends.append(send_sms(user["phone"]))
+        if tokens:
+            sends.append(send_fcm(tokens))
+        await asyncio.gather(*sends)
+    
+    targets = 0
+    after_id = 0
+    try:
+        await _set_broadcast_status(task_id, "running", started_at=started_at)
+        # Recipients come a page per request, so the auth service's connection is
+        # released before each page is sent rather than held for the whole broadcast
+        while after_id is not None:
+            response = await service.get_http_client().get(
+                f"{settings.auth_service_url}/internal/users/active-contacts",
+                params={"after_id": after_id, "limit": settings.notification_batch_size}
+            )
+            response.raise_for_status()
+            page = response.json()
+            if page["users"]:
+                targets += len(page["users"])
+                await dispatch(page["users"])
+            after_id = page["next_after_id"]
+        
+        logger.info(f"Broadcast {task_id} sent to {targets} users")
+        await _set_broadcast_status(
+            task_id, "completed", started_at=started_at, targets=targets, results=counts
+        )
+    except Exception as e:
+        logger.error(f"Broadcast {task_id} failed: {e}")
         try:
-            email_success = await service.send_email_notification(
-                request.email,
-                f"Order Update - #{request.order_id}",
-                f"<h2>Order Update</h2><p>Your order #{request.order_id} is {request.status}</p>"
+            await _set_broadcast_status(
+                task_id, "failed", started_at=started_at, targets=targets, results=counts, error=str(e)
             )
-            results["email"] = email_success
-        except Exception as e:
-            results["email"] = False
-            logger.error(f"Email notification failed: {e}")
+        except Exception as status_error:
+            logger.error(f"Broadcast {task_id} status could not be recorded: {status_error}")
+
+@router.post("/broadcast", status_code=status.HTTP_202_ACCEPTED)
+async def broadcast_notification(request: BroadcastRequest, background_tasks: BackgroundTasks):
+    """Queue a broadcast to every active user and return its task id straight away
     
-    logger.info(f"Order notification sent for order {request.order_id}")
-    return {"message": "Order notification sent", "results": results}
\ No newline at end of file
+    The broadcast runs in this process as a background task and is not durable: if the
+    replica restarts mid-send, the remaining recipients are not notified and the status
+    stays "running" until it expires. Its started_at shows how long it has been running.
+    """
+    # Without a deliverable channel there is nothing to send, so skip fetching the audience
+    channels = [channel for channel in dict.fromkeys(request.channels) if channel in BROADCAST_CHANNELS]
+    if not channels:
+        return {"task_id": None, "status": "skipped", "message": "No supported channels requested"}
+    
+    request = request.model_copy(update={"channels": channels})
+    task_id = uuid.uuid4().hex
+    await _set_broadcast_status(task_id, "queued")
+    background_tasks.add_task(run_broadcast, task_id, request)
+    return {"task_id": task_id, "status": "queued"}
+
+@router.get("/broadcast/{task_id}")
+async def get_broadcast_status(task_id: str):
+    """Get the progress or outcome of a queued broadcast"""
+    entry = await NotificationService.get_redis().get(BROADCAST_STATUS_PREFIX + task_id)
+    if entry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Broadcast not found")
+    return orjson.loads(entry)
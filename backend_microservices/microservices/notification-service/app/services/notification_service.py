@@ -1,35 +1,117 @@
 import asyncio
-import sys
-import os
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, List
 import logging
+import httpx
+import orjson
+import redis.asyncio as aioredis
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
+from custom_circuit_breaker import CircuitBreaker, RetryConfig, CircuitBreakerError, retry_with_backoff
+from ..config import settings
 
-from custom_circuit_breaker import CircuitBreaker, RetryConfig, CircuitBreakerError
+logger = logging.getLogger(__name__)
+
+TWILIO_MESSAGES_URL = "https://api.twilio.com/2010-04-01/Accounts/{sid}/Messages.json"
+RESEND_EMAILS_URL = "https://api.resend.com/emails"
+# Settings are fixed for the life of the process, so provider auth is built once at import
+RESEND_HEADERS = {"Authorization": f"Bearer {settings.resend_api_key}", "Content-Type": "application/json"}
+TWILIO_URL = TWILIO_MESSAGES_URL.format(sid=settings.twilio_account_sid)
+TWILIO_AUTH = (settings.twilio_account_sid, settings.twilio_auth_token)
+
+# FCM accepts at most 500 registration tokens per multicast message
+FCM_MULTICAST_LIMIT = 500
+# Multicast batches in flight at once for a single large send
+FCM_MULTICAST_CONCURRENCY = 8
+
+# Provider calls in flight per channel across all requests, so bursts queue here instead of
+# exhausting connections and file descriptors; a multicast batch holds one FCM slot
+FCM_CONCURRENCY = 50
+EMAIL_CONCURRENCY = 20
+SMS_CONCURRENCY = 20
+
+# Transient provider failures (transport errors, 429, 5xx) get two more tries, backing off 0.2s to 2s
+PROVIDER_RETRY = RetryConfig(max_attempts=3, base_delay=0.2, max_delay=2.0)
+
+# Bounds for the shared provider client; HTTP/2 is negotiated where the provider offers it
+HTTP_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+# An unreachable provider fails within a second instead of holding a send for the full budget
+HTTP_CLIENT_TIMEOUT = httpx.Timeout(5.0, connect=1.0)
+# Seconds for each FCM HTTP call; firebase-admin waits 120s by default
+FCM_HTTP_TIMEOUT = 5
 
 # Firebase Admin SDK (modern approach)
 try:
     import firebase_admin
     from firebase_admin import credentials, messaging
-    from ..config import settings
-    
-    # Initialize Firebase Admin SDK
-    if not firebase_admin._apps:
-        cred = credentials.Certificate(settings.firebase_credentials_path)
-        firebase_admin.initialize_app(cred)
-    
     FIREBASE_AVAILABLE = True
 except ImportError:
     FIREBASE_AVAILABLE = False
     logging.warning("Firebase Admin SDK not available - using mock notifications")
 
+@functools.lru_cache(maxsize=1)
+def initialize_firebase():
+    """Initialize the Firebase Admin SDK on first use rather than at import"""
+    if not firebase_admin._apps:
+        cred = credentials.Certificate(settings.firebase_credentials_path)
+        firebase_admin.initialize_app(cred, {"httpTimeout": FCM_HTTP_TIMEOUT})
+
 class NotificationService:
+    # Shared HTTP client keeps outbound connections alive between messages
+    _http_client = None
+    _redis = None
+    
     def __init__(self):
         self.fcm_circuit_breaker = CircuitBreaker(name="FCM")
         self.email_circuit_breaker = CircuitBreaker(name="Email")
         self.sms_circuit_breaker = CircuitBreaker(name="SMS")
+        self.fcm_slots = asyncio.Semaphore(FCM_CONCURRENCY)
+        self.email_slots = asyncio.Semaphore(EMAIL_CONCURRENCY)
+        self.sms_slots = asyncio.Semaphore(SMS_CONCURRENCY)
+    
+    @classmethod
+    def get_http_client(cls) -> httpx.AsyncClient:
+        if cls._http_client is None:
+            cls._http_client = httpx.AsyncClient(http2=True, timeout=HTTP_CLIENT_TIMEOUT, limits=HTTP_CLIENT_LIMITS)
+        return cls._http_client
+    
+    @classmethod
+    def get_redis(cls) -> aioredis.Redis:
+        if cls._redis is None:
+            cls._redis = aioredis.from_url(settings.redis_url)
+        return cls._redis
+    
+    @classmethod
+    async def _post_with_retry(cls, url: str, **kwargs) -> httpx.Response:
+        """POST to a provider, retrying only failures that may pass on their own"""
+        async def attempt() -> httpx.Response:
+            response = await cls.get_http_client().post(url, **kwargs)
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
+            return response
+        
+        try:
+            return await retry_with_backoff(attempt, PROVIDER_RETRY)
+        except httpx.HTTPStatusError as e:
+            # Still failing after the last attempt; the caller judges the final response
+            return e.response
+    
+    @staticmethod
+    def _record_outcome(breaker: CircuitBreaker, healthy: bool):
+        """Report a provider call so successes close the breaker again, not only failures open it"""
+        if not healthy:
+            breaker.record_failure()
+        elif breaker.failure_count:
+            breaker.record_success()
+    
+    @classmethod
+    async def close_clients(cls):
+        """Close shared connections on shutdown"""
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+        if cls._redis is not None:
+            await cls._redis.aclose()
+            cls._redis = None
     
     async def send_fcm_notification(self, token: str, message: Dict[str, str], data: Dict[str, Any]) -> bool:
         """Send FCM notification using Firebase Admin SDK"""
@@ -38,6 +120,7 @@ class NotificationService:
         
         try:
             if FIREBASE_AVAILABLE:
+                initialize_firebase()
                 # Modern Firebase Admin SDK approach
                 fcm_message = messaging.Message(
                     notification=messaging.Notification(
@@ -48,19 +131,70 @@ class NotificationService:
                     token=token
                 )
                 
-                # Send message
-                response = messaging.send(fcm_message)
-                print(f"FCM sent successfully: {response}")
+                # Async HTTP/2 send; there is no single-message async call, so it goes as a batch of one
+                async with self.fcm_slots:
+                    batch = await messaging.send_each_async([fcm_message])
+                response = batch.responses[0]
+                if not response.success:
+                    raise response.exception
+                logger.debug(f"FCM sent successfully: {response.message_id}")
+                self._record_outcome(self.fcm_circuit_breaker, True)
                 return True
             else:
                 # Mock implementation
-                print(f"FCM (Mock): {message['title']} - {message['body']} to {token[:10]}...")
+                logger.debug(f"FCM (Mock): {message['title']} - {message['body']} to {token[:10]}...")
                 await asyncio.sleep(0.1)
                 return True
                 
         except Exception as e:
-            print(f"FCM Error: {e}")
-            self.fcm_circuit_breaker.is_open = True
+            logger.error(f"FCM Error: {e}")
+            self.fcm_circuit_breaker.record_failure()
+            raise
+    
+    async def send_fcm_multicast(self, tokens: List[str], message: Dict[str, str], data: Dict[str, Any]) -> List[bool]:
+        """Send one FCM notification to many tokens, 500 tokens per request"""
+        if self.fcm_circuit_breaker.is_open:
+            raise CircuitBreakerError("FCM circuit breaker is open")
+        
+        try:
+            if FIREBASE_AVAILABLE:
+                initialize_firebase()
+                notification = messaging.Notification(
+                    title=message.get('title', ''),
+                    body=message.get('body', '')
+                )
+                fcm_data = {str(k): str(v) for k, v in data.items()}
+                semaphore = asyncio.Semaphore(FCM_MULTICAST_CONCURRENCY)
+                
+                async def send_batch(batch_tokens: List[str]) -> List[bool]:
+                    multicast = messaging.MulticastMessage(
+                        tokens=batch_tokens,
+                        notification=notification,
+                        data=fcm_data
+                    )
+                    async with semaphore, self.fcm_slots:
+                        batch = await messaging.send_each_for_multicast_async(multicast)
+                    return [response.success for response in batch.responses]
+                
+                # Batches overlap their round trips; gather keeps results in token order
+                batches = await asyncio.gather(*(
+                    send_batch(tokens[start:start + FCM_MULTICAST_LIMIT])
+                    for start in range(0, len(tokens), FCM_MULTICAST_LIMIT)
+                ))
+                results = [success for batch in batches for success in batch]
+                
+                logger.debug(f"FCM multicast sent: {sum(results)}/{len(tokens)} succeeded")
+                self._record_outcome(self.fcm_circuit_breaker, True)
+                return results
+            else:
+                # Mock implementation
+                logger.debug(f"FCM (Mock): {message['title']} - {message['body']} to {len(tokens)} tokens")
+                await asyncio.sleep(0.1)
+                return [True] * len(tokens)
+                
+        except Exception as e:
+            logger.error(f"FCM Error: {e}")
+            self.fcm_circuit_breaker.record_failure()
             raise
     
     async def send_email_notification(self, email: str, subject: str, content: str) -> bool:
@@ -69,12 +203,27 @@ class NotificationService:
             raise CircuitBreakerError("Email circuit breaker is open")
         
         try:
-            # Mock email notification (integrate with Resend API)
-            print(f"Email to {email}: {subject}")
-            await asyncio.sleep(0.1)
-            return True
+            if settings.resend_from_email:
+                # Sent over the shared client so Resend calls reuse pooled connections
+                async with self.email_slots:
+                    response = await self._post_with_retry(
+                        RESEND_EMAILS_URL,
+                        headers=RESEND_HEADERS,
+                        # orjson encodes large HTML bodies straight to bytes, far faster than httpx's stdlib json
+                        content=orjson.dumps(
+                            {"from": settings.resend_from_email, "to": [email], "subject": subject, "html": content}
+                        )
+                    )
+                # Provider-side errors count against the breaker; rejected requests do not
+                self._record_outcome(self.email_circuit_breaker, response.status_code < 500)
+                return response.status_code < 400
+            else:
+                # Mock email notification
+                logger.debug(f"Email to {email}: {subject}")
+                await asyncio.sleep(0.1)
+                return True
         except Exception as e:
-            self.email_circuit_breaker.is_open = True
+            self.email_circuit_breaker.record_failure()
             raise
     
     async def send_sms_notification(self, phone: str, message: str) -> bool:
@@ -83,10 +232,26 @@ class NotificationService:
             raise CircuitBreakerError("SMS circuit breaker is open")
         
         try:
-            # Mock SMS notification
-            print(f"SMS to {phone}: {message}")
-            await asyncio.sleep(0.1)
-            return True
+            if settings.twilio_account_sid and settings.twilio_auth_token:
+                # Post straight to the Twilio REST API instead of the blocking SDK
+                async with self.sms_slots:
+                    response = await self._post_with_retry(
+                        TWILIO_URL,
+                        auth=TWILIO_AUTH,
+                        data={"To": phone, "From": settings.twilio_from_number, "Body": message}
+                    )
+                self._record_outcome(self.sms_circuit_breaker, response.status_code < 500)
+                return response.status_code < 400
+            else:
+                # Mock SMS notification
+                logger.debug(f"SMS to {phone}: {message}")
+                await asyncio.sleep(0.1)
+                return True
         except Exception as e:
-            self.sms_circuit_breaker.is_open = True
-            raise
\ No newline at end of file
+            self.sms_circuit_breaker.record_failure()
+            raise
+
+@functools.lru_cache(maxsize=1)
+def get_notification_service() -> NotificationService:
+    """Shared instance so circuit breaker state and clients live across requests"""
+    return NotificationService()
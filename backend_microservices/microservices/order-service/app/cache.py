@@ -0,0 +1,45 @@
+import redis.asyncio as aioredis
+import logging
+from typing import Optional
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rendered order history pages, one hash per user so a single DEL drops every page
+USER_ORDERS_CACHE_PREFIX = "orders:user:"
+USER_ORDERS_CACHE_TTL_SECONDS = 30
+
+_redis_client = None
+
+def get_redis() -> aioredis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(settings.redis_url)
+    return _redis_client
+
+def user_orders_cache_key(user_id: int) -> str:
+    return f"{USER_ORDERS_CACHE_PREFIX}{user_id}:v1"
+
+async def get_user_orders_page(user_id: int, page: str) -> Optional[bytes]:
+    """Return the cached JSON body for a page, or None on a miss or when Redis is unavailable"""
+    try:
+        return await get_redis().hget(user_orders_cache_key(user_id), page)
+    except Exception as e:
+        logger.debug(f"Order history cache read failed for user {user_id}: {e}")
+    return None
+
+async def set_user_orders_page(user_id: int, page: str, body: bytes):
+    key = user_orders_cache_key(user_id)
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.hset(key, page, body)
+            pipe.expire(key, USER_ORDERS_CACHE_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.debug(f"Order history cache write failed for user {user_id}: {e}")
+
+async def invalidate_user_orders(user_id: int):
+    try:
+        await get_redis().delete(user_orders_cache_key(user_id))
+    except Exception as e:
+        logger.debug(f"Order history cache delete failed for user {user_id}: {e}")
@@ -1,8 +1,5 @@
-import sys
-import os
 import logging
 from typing import List, Dict, Any
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
 
 from shared_config import BaseServiceSettings, ConfigurationError
 
@@ -14,6 +11,8 @@ class OrderServiceSettings(BaseServiceSettings):
     # External service URLs
     cart_service_url: str = "http://localhost:8003"
     notification_service_url: str = "http://localhost:8006"
+    # Source of the contact details order notifications are sent to
+    auth_service_url: str = "http://localhost:8001"
     
     # Order-specific settings
     order_timeout_minutes: int = 30
@@ -40,7 +39,8 @@ class OrderServiceSettings(BaseServiceSettings):
             "order_timeout_minutes",
             "max_order_value",
             "order_status_update_interval_seconds",
-            "payment_timeout_minutes"
+            "payment_timeout_minutes",
+            "auth_service_url"
         ]
         return base_vars + order_vars
     
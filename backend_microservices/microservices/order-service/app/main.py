@@ -1,22 +1,21 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routes import orders
+from .routes import orders, internal, admin
 from .config import settings
 from .database import db_manager
-import sys
-import os
-
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
+from .services.analytics_service import AnalyticsService
+import asyncio
 
 from custom_logging import setup_logging
+from responses import ORJSONResponse
 from health_checks import HealthChecker, create_fastapi_health_endpoints
 from startup_validation import create_startup_event_handler
 
 app = FastAPI(
     title="Order Service",
     description="Order Management Service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Setup logging
@@ -28,6 +27,20 @@ app.add_event_handler(
     create_startup_event_handler("order-service", db_manager.get_db, settings)
 )
 
+# Background refresh of the dashboard analytics views
+view_refresher = None
+
+async def start_view_refresher():
+    global view_refresher
+    view_refresher = asyncio.create_task(AnalyticsService.run_view_refresher())
+
+async def stop_view_refresher():
+    if view_refresher:
+        view_refresher.cancel()
+
+app.add_event_handler("startup", start_view_refresher)
+app.add_event_handler("shutdown", stop_view_refresher)
+
 # Setup comprehensive health checks
 health_checker = HealthChecker("order-service", logger)
 
@@ -65,4 +78,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(orders.router, tags=["Orders"])
\ No newline at end of file
+app.include_router(orders.router, tags=["Orders"])
+app.include_router(internal.router, prefix="/internal", tags=["Internal"])
+app.include_router(admin.router, prefix="/admin", tags=["Admin"])
\ No newline at end of file
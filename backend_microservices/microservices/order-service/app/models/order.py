@@ -1,6 +1,9 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Enum, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Enum, Text, Float, Index, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
 import enum
 from ..database import Base
 
@@ -15,30 +18,45 @@ class OrderStatus(enum.Enum):
 class Order(Base):
     __tablename__ = "orders"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, nullable=False, index=True)
     delivery_partner_id = Column(Integer)
     total_amount = Column(Numeric(10,2), nullable=False)
     delivery_fee = Column(Numeric(10,2), default=0)
-    status = Column(Enum(OrderStatus), default=OrderStatus.PENDING)
+    status = Column(
+        Enum(OrderStatus, name="order_status", values_callable=lambda e: [x.value for x in e]),
+        default=OrderStatus.PENDING
+    )
     delivery_address = Column(Text, nullable=False)
-    delivery_latitude = Column(String(20))
-    delivery_longitude = Column(String(20))
+    delivery_latitude = Column(Float)
+    delivery_longitude = Column(Float)
     estimated_delivery_time = Column(DateTime(timezone=True))
     delivered_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Keyset pagination for the admin order list
+        Index('idx_orders_created_id', text('created_at DESC'), text('id DESC')),
+        # Keyset pagination for a user's order history
+        Index('idx_orders_user_created_id', 'user_id', text('created_at DESC'), text('id DESC')),
+    )
 
 class OrderItem(Base):
     __tablename__ = "order_items"
     
-    id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
-    product_id = Column(Integer, nullable=False)
-    quantity = Column(Integer, nullable=False)
-    price = Column(Numeric(10,2), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True)
+    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"))
+    product_id: Mapped[int]
+    quantity: Mapped[int]
+    price: Mapped[Decimal] = mapped_column(Numeric(10,2))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    
+    order: Mapped["Order"] = relationship(back_populates="items")
     
-    order = relationship("Order", back_populates="items")
\ No newline at end of file
+    __table_args__ = (
+        Index('idx_orderitem_order', 'order_id'),
+        Index('idx_orderitem_product', 'product_id'),
+    )
\ No newline at end of file
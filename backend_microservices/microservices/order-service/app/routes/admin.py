@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import selectinload, raiseload
+from datetime import datetime
+from typing import List, Optional
+from pydantic import TypeAdapter
+from ..database import get_db
+from ..models.order import Order
+from ..schemas.order import OrderResponse
+
+from custom_logging import setup_logging
+
+logger = setup_logging("order-service-admin", log_level="INFO")
+
+router = APIRouter()
+
+# Validates a page of ORM rows in a single call
+ORDER_LIST = TypeAdapter(List[OrderResponse])
+
+@router.get("/orders")
+async def get_all_orders(
+    limit: int = Query(50, ge=1, le=100),
+    after_created_at: Optional[datetime] = Query(None, description="created_at of the last order on the previous page"),
+    after_id: Optional[int] = Query(None, description="id of the last order on the previous page"),
+    db: AsyncSession = Depends(get_db)
+):
+    """List orders newest first using keyset pagination on (created_at, id)"""
+    query = select(Order).options(
+        selectinload(Order.items), raiseload("*")
+    ).order_by(Order.created_at.desc(), Order.id.desc()).limit(limit)
+    
+    # Seek past the previous page through idx_orders_created_id instead of OFFSET
+    if after_created_at is not None and after_id is not None:
+        query = query.where(tuple_(Order.created_at, Order.id) < tuple_(after_created_at, after_id))
+    
+    result = await db.execute(query)
+    orders = result.scalars().all()
+    
+    next_cursor = None
+    if len(orders) == limit:
+        last = orders[-1]
+        next_cursor = {"after_created_at": last.created_at.isoformat(), "after_id": last.id}
+    
+    logger.info(f"Admin order page returned {len(orders)} orders")
+    return {
+        "orders": ORDER_LIST.validate_python(orders, from_attributes=True),
+        "next_cursor": next_cursor
+    }
@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, bindparam
+from datetime import datetime, timedelta, timezone
+from ..database import get_db
+from ..models.order import Order, OrderStatus
+from ..services.analytics_service import AnalyticsService
+
+from custom_logging import setup_logging
+
+logger = setup_logging("order-service-internal", log_level="INFO")
+
+router = APIRouter()
+
+# One grouped scan yields the per-status counts and the totals derived from them
+ORDER_STATS_BY_STATUS = select(
+    Order.status,
+    func.count(Order.id).label("count"),
+    func.coalesce(func.sum(Order.total_amount), 0).label("revenue")
+).group_by(Order.status)
+
+@router.get("/stats")
+async def get_order_stats(db: AsyncSession = Depends(get_db)):
+    """Internal endpoint for admin order statistics"""
+    result = await db.execute(ORDER_STATS_BY_STATUS)
+    rows = result.all()
+    
+    orders_by_status = {order_status.value: 0 for order_status in OrderStatus}
+    total_revenue = 0.0
+    for row in rows:
+        orders_by_status[row.status.value] = row.count
+        if row.status != OrderStatus.CANCELLED:
+            total_revenue += float(row.revenue)
+    
+    return {
+        "total_orders": sum(orders_by_status.values()),
+        "total_revenue": total_revenue,
+        "orders_by_status": orders_by_status
+    }
+
+
+# The WHERE clause lets idx_order_created_at bound the scan, and FILTER
+# aggregates compute every period metric in that single pass
+_delivered = Order.status == OrderStatus.DELIVERED
+ORDER_PERIOD_ANALYTICS = select(
+    func.count(Order.id).label("period_orders"),
+    func.coalesce(func.sum(Order.total_amount).filter(_delivered), 0).label("period_revenue"),
+    func.coalesce(func.avg(Order.total_amount).filter(_delivered), 0).label("avg_order_value"),
+    func.count(Order.id).filter(Order.status == OrderStatus.CANCELLED).label("cancelled_orders")
+).where(Order.created_at >= bindparam("start"))
+
+@router.get("/analytics")
+async def get_order_analytics(
+    days: int = Query(30, ge=1, le=365),
+    db: AsyncSession = Depends(get_db)
+):
+    """Internal endpoint for admin dashboard order analytics"""
+    start = datetime.now(timezone.utc) - timedelta(days=days)
+    result = await db.execute(ORDER_PERIOD_ANALYTICS, {"start": start})
+    row = result.one()
+    
+    return {
+        "days": days,
+        "period_orders": row.period_orders,
+        "period_revenue": float(row.period_revenue),
+        "avg_order_value": float(row.avg_order_value),
+        "cancelled_orders": row.cancelled_orders,
+        # Served from hourly materialized views, always covering the last 30 days
+        "top_products_30d": await AnalyticsService.get_top_products(db),
+        "daily_revenue_30d": await AnalyticsService.get_daily_revenue(db)
+    }
@@ -1,23 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from typing import List
+from sqlalchemy import select, tuple_, bindparam
+from sqlalchemy.orm import selectinload, raiseload
+from datetime import datetime
+from typing import Optional, Tuple
+import base64
 from ..database import get_db
 from ..models.order import Order, OrderStatus
-from ..schemas.order import OrderCreate, OrderResponse, OrderStatusUpdate
+from ..schemas.order import OrderCreate, OrderPage, OrderResponse, OrderStatusUpdate
 from ..services.order_service import OrderService
-import sys
-import os
+from .. import cache
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 from custom_logging import setup_logging
+from responses import ORJSONResponse, orm_to_dict
 
 logger = setup_logging("order-service", log_level="INFO")
 
 router = APIRouter()
 
+# Built once at import; per-request values are bound as parameters
+USER_ORDERS = select(Order).options(
+    selectinload(Order.items), raiseload("*")
+).where(Order.user_id == bindparam("user_id")).order_by(
+    Order.created_at.desc(), Order.id.desc()
+)
+SELECT_USER_ORDER = select(Order).options(
+    selectinload(Order.items), raiseload("*")
+).where(Order.id == bindparam("order_id"), Order.user_id == bindparam("user_id"))
+
 async def get_user_id_from_header(x_user_id: str = Header(...)) -> int:
     """Get user ID from header (set by API Gateway)"""
     try:
@@ -25,39 +35,67 @@ async def get_user_id_from_header(x_user_id: str = Header(...)) -> int:
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="Invalid user ID")
 
+def _encode_cursor(order: Order) -> str:
+    """Opaque cursor pointing just past the given order"""
+    return base64.urlsafe_b64encode(f"{order.created_at.isoformat()}|{order.id}".encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, order_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(order_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.post("/create", response_model=OrderResponse)
 async def create_order(
     order_data: OrderCreate,
+    background_tasks: BackgroundTasks,
     user_id: int = Depends(get_user_id_from_header),
     db: AsyncSession = Depends(get_db)
 ):
     """Create order from cart"""
     logger.info(f"Creating order for user {user_id}")
     order = await OrderService.create_order(db, user_id, order_data)
+    await cache.invalidate_user_orders(user_id)
+    # Notified after the response is sent so the client never waits on downstream services
+    background_tasks.add_task(
+        OrderService.notify_order_status, user_id, order.id, order.status, order.total_amount
+    )
     logger.info(f"Order {order.id} created for user {user_id}")
     return order
 
-@router.get("/my-orders", response_model=List[OrderResponse])
+# Read routes return ready-made responses; the schemas only document them
+@router.get("/my-orders", response_model=None, responses={200: {"model": OrderPage}})
 async def get_my_orders(
     user_id: int = Depends(get_user_id_from_header),
-    limit: int = Query(20, le=50),
-    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get current user's orders"""
+    """Get current user's orders newest first using keyset pagination on (created_at, id)"""
+    page = f"{limit}:{cursor or ''}"
+    cached = await cache.get_user_orders_page(user_id, page)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
     logger.info(f"Fetching orders for user {user_id}")
-    result = await db.execute(
-        select(Order).options(
-            selectinload(Order.items).selectinload(Order.items.product)
-        ).where(Order.user_id == user_id)
-        .order_by(Order.created_at.desc())
-        .offset(offset).limit(limit)
-    )
+    query = USER_ORDERS.limit(limit)
+    
+    # Seek past the previous page through idx_orders_user_created_id instead of OFFSET
+    if cursor:
+        query = query.where(tuple_(Order.created_at, Order.id) < tuple_(*_decode_cursor(cursor)))
+    
+    result = await db.execute(query, {"user_id": user_id})
     orders = result.scalars().all()
     logger.info(f"Found {len(orders)} orders for user {user_id}")
-    return [OrderResponse.model_validate(order) for order in orders]
+    response = ORJSONResponse({
+        "orders": [orm_to_dict(OrderResponse, order) for order in orders],
+        "next_cursor": _encode_cursor(orders[-1]) if len(orders) == limit else None
+    })
+    await cache.set_user_orders_page(user_id, page, response.body)
+    return response
 
-@router.get("/{order_id}", response_model=OrderResponse)
+@router.get("/{order_id}", response_model=None, responses={200: {"model": OrderResponse}})
 async def get_order(
     order_id: int,
     user_id: int = Depends(get_user_id_from_header),
@@ -65,27 +103,28 @@ async def get_order(
 ):
     """Get specific order"""
     logger.info(f"Fetching order {order_id} for user {user_id}")
-    result = await db.execute(
-        select(Order).options(
-            selectinload(Order.items).selectinload(Order.items.product)
-        ).where(Order.id == order_id, Order.user_id == user_id)
-    )
+    result = await db.execute(SELECT_USER_ORDER, {"order_id": order_id, "user_id": user_id})
     order = result.scalar_one_or_none()
     
     if not order:
         logger.warning(f"Order {order_id} not found for user {user_id}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
     
-    return OrderResponse.model_validate(order)
+    return ORJSONResponse(orm_to_dict(OrderResponse, order))
 
 @router.put("/{order_id}/status", response_model=OrderResponse)
 async def update_order_status(
     order_id: int,
     status_update: OrderStatusUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Update order status (admin/delivery partner only)"""
     logger.info(f"Updating order {order_id} status to {status_update.status}")
     order = await OrderService.update_order_status(db, order_id, status_update.status)
+    await cache.invalidate_user_orders(order.user_id)
+    background_tasks.add_task(
+        OrderService.notify_order_status, order.user_id, order.id, order.status, order.total_amount
+    )
     logger.info(f"Order {order_id} status updated to {status_update.status}")
     return order
\ No newline at end of file
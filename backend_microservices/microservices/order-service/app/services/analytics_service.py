@@ -0,0 +1,54 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+from ..database import db_manager
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Dashboard aggregates over the last 30 days are precomputed in these views
+ANALYTICS_VIEWS = ("mv_top_products_30d", "mv_daily_revenue_30d")
+ANALYTICS_REFRESH_INTERVAL_SECONDS = 3600
+
+SELECT_TOP_PRODUCTS = text(
+    "SELECT product_id, quantity_sold, revenue FROM mv_top_products_30d "
+    "ORDER BY quantity_sold DESC LIMIT :limit"
+)
+SELECT_DAILY_REVENUE = text("SELECT day, orders, revenue FROM mv_daily_revenue_30d ORDER BY day")
+
+class AnalyticsService:
+    @staticmethod
+    async def get_top_products(db: AsyncSession, limit: int = 10):
+        result = await db.execute(SELECT_TOP_PRODUCTS, {"limit": limit})
+        return [
+            {"product_id": row.product_id, "quantity_sold": int(row.quantity_sold), "revenue": float(row.revenue)}
+            for row in result
+        ]
+    
+    @staticmethod
+    async def get_daily_revenue(db: AsyncSession):
+        result = await db.execute(SELECT_DAILY_REVENUE)
+        return [
+            {"date": row.day.isoformat(), "orders": row.orders, "revenue": float(row.revenue)}
+            for row in result
+        ]
+    
+    @staticmethod
+    async def refresh_views():
+        """Rebuild the analytics views without blocking readers"""
+        async with db_manager.AsyncSessionLocal() as db:
+            for view in ANALYTICS_VIEWS:
+                await db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+            await db.commit()
+    
+    @classmethod
+    async def run_view_refresher(cls):
+        """Refresh the analytics views hourly until cancelled"""
+        while True:
+            try:
+                await cls.refresh_views()
+                logger.info("Refreshed analytics materialized views")
+            except Exception as e:
+                # Readers keep getting the previous snapshot until the next successful refresh
+                logger.error(f"Analytics view refresh failed: {e}")
+            await asyncio.sleep(ANALYTICS_REFRESH_INTERVAL_SECONDS)
@@ -1,55 +1,119 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, update, bindparam
+import httpx
+import logging
 from ..models.order import Order, OrderItem
 from ..schemas.order import OrderCreate, OrderResponse, OrderStatus
+from ..config import settings
 from fastapi import HTTPException
-import sys
-import os
-
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 
 from custom_circuit_breaker import CircuitBreaker, RetryConfig, CircuitBreakerError
 
+logger = logging.getLogger(__name__)
+
+# Built once at import so the compiled statement and its prepared plan are reused.
+# The status is a bound parameter the ORM cannot evaluate in Python, so an Order
+# already in the session is overwritten from RETURNING via populate_existing.
+UPDATE_ORDER_STATUS = (
+    update(Order)
+    .where(Order.id == bindparam("order_id"))
+    .values(status=bindparam("status"))
+    .returning(Order)
+    .execution_options(populate_existing=True)
+)
+
 class OrderService:
+    # Shared HTTP client keeps connections to the auth and notification services alive
+    _http_client = None
+    # Built once per process; a breaker created per call starts closed every time and can never trip
+    order_creation_breaker = CircuitBreaker(name="OrderCreation")
+    order_status_breaker = CircuitBreaker(name="OrderStatusUpdate")
+    # Sheds notification tasks while the notification service is down instead of queueing timeouts
+    notification_breaker = CircuitBreaker(name="NotificationService")
+    
     def __init__(self):
         self.cart_circuit_breaker = CircuitBreaker(name="CartService")
-        self.notification_circuit_breaker = CircuitBreaker(name="NotificationService")
+    
+    @classmethod
+    def get_http_client(cls) -> httpx.AsyncClient:
+        if cls._http_client is None:
+            cls._http_client = httpx.AsyncClient(timeout=5.0)
+        return cls._http_client
+    
+    @classmethod
+    async def notify_order_status(cls, user_id: int, order_id: int, status: OrderStatus, total_amount: float):
+        """Send an order status notification; run after the response so failures never reach the client"""
+        if cls.notification_breaker.is_open:
+            logger.debug(f"Order {order_id} notification skipped: notification service breaker is open")
+            return
+        
+        client = cls.get_http_client()
+        try:
+            user_response = await client.get(f"{settings.auth_service_url}/internal/users/{user_id}")
+            user_response.raise_for_status()
+            user = user_response.json()
+        except Exception as e:
+            logger.error(f"Order {order_id} notification failed: {e}")
+            return
+        
+        try:
+            response = await client.post(
+                f"{settings.notification_service_url}/order-status",
+                json={
+                    "user_id": user_id,
+                    "order_id": order_id,
+                    "status": OrderStatus(status).value,
+                    "fcm_token": user.get("fcm_token"),
+                    "email": user.get("email"),
+                    "phone": user.get("phone"),
+                    "total_amount": float(total_amount) if total_amount is not None else None
+                }
+            )
+        except Exception as e:
+            cls.notification_breaker.record_failure()
+            logger.error(f"Order {order_id} notification failed: {e}")
+            return
+        
+        # Only server-side errors say the notification service is unhealthy
+        if response.status_code >= 500:
+            cls.notification_breaker.record_failure()
+        elif cls.notification_breaker.failure_count:
+            cls.notification_breaker.record_success()
+        if response.is_error:
+            logger.error(f"Order {order_id} notification failed with status {response.status_code}")
     
     @staticmethod
     async def create_order(db: AsyncSession, user_id: int, order_data: OrderCreate) -> OrderResponse:
         """Create order from cart with circuit breaker"""
-        circuit_breaker = CircuitBreaker(name="OrderCreation")
+        circuit_breaker = OrderService.order_creation_breaker
         
         if circuit_breaker.is_open:
             raise CircuitBreakerError("Order creation circuit breaker is open")
         
         try:
-            # Create order
-            order = Order(
-                user_id=user_id,
-                status=OrderStatus.PENDING,
-                total_amount=100.0,  # Mock amount
-                delivery_address=order_data.delivery_address,
-                delivery_time_slot=order_data.delivery_time_slot,
-                payment_method=order_data.payment_method,
-                notes=order_data.notes
+            # Create order; RETURNING hands back the id and server defaults without a refresh
+            result = await db.execute(
+                insert(Order).values(
+                    user_id=user_id,
+                    status=OrderStatus.PENDING,
+                    total_amount=100.0,  # Mock amount
+                    delivery_address=order_data.delivery_address,
+                    delivery_time_slot=order_data.delivery_time_slot,
+                    payment_method=order_data.payment_method,
+                    notes=order_data.notes
+                ).returning(Order)
             )
+            order = result.scalar_one()
             
-            db.add(order)
-            await db.commit()
-            await db.refresh(order)
-            
-            # Mock order items
-            order_item = OrderItem(
-                order_id=order.id,
-                product_id=1,
-                quantity=2,
-                price=50.0,
-                total_price=100.0
-            )
-            db.add(order_item)
+            # Mock order items, written as a single multi-row INSERT ... VALUES statement
+            order_items = [
+                {"order_id": order.id, "product_id": 1, "quantity": 2, "price": 50.0}
+            ]
+            await db.execute(insert(OrderItem).values(order_items))
+            # Order and items commit together
             await db.commit()
+            if circuit_breaker.failure_count:
+                circuit_breaker.record_success()
             
             return OrderResponse(
                 id=order.id,
@@ -64,28 +128,33 @@ class OrderService:
                 created_at=order.created_at,
                 updated_at=order.updated_at
             )
+        except HTTPException:
+            # Client errors such as a missing order say nothing about the database
+            raise
         except Exception as e:
-            circuit_breaker.is_open = True
+            circuit_breaker.record_failure()
             raise
     
     @staticmethod
     async def update_order_status(db: AsyncSession, order_id: int, status: OrderStatus) -> OrderResponse:
         """Update order status with circuit breaker"""
-        circuit_breaker = CircuitBreaker(name="OrderStatusUpdate")
+        circuit_breaker = OrderService.order_status_breaker
         
         if circuit_breaker.is_open:
             raise CircuitBreakerError("Order status update circuit breaker is open")
         
         try:
-            result = await db.execute(select(Order).where(Order.id == order_id))
+            result = await db.execute(
+                UPDATE_ORDER_STATUS, {"order_id": order_id, "status": status}
+            )
             order = result.scalar_one_or_none()
             
             if not order:
                 raise HTTPException(status_code=404, detail="Order not found")
             
-            order.status = status
             await db.commit()
-            await db.refresh(order)
+            if circuit_breaker.failure_count:
+                circuit_breaker.record_success()
             
             return OrderResponse(
                 id=order.id,
@@ -100,6 +169,9 @@ class OrderService:
                 created_at=order.created_at,
                 updated_at=order.updated_at
             )
+        except HTTPException:
+            # Client errors such as a missing order say nothing about the database
+            raise
         except Exception as e:
-            circuit_breaker.is_open = True
+            circuit_breaker.record_failure()
             raise
\ No newline at end of file
@@ -0,0 +1,53 @@
+import redis.asyncio as aioredis
+from cachetools import TTLCache
+import logging
+import orjson
+from typing import Any, Optional
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Catalog reads are served from Redis; keys are versioned so a schema change can bypass old entries
+CATEGORIES_CACHE_KEY = "products:categories:v1"
+CATEGORIES_CACHE_TTL_SECONDS = 300
+# In-process copy of the category list in front of Redis; kept short because
+# replicas cannot invalidate each other's memory
+CATEGORIES_LOCAL_TTL_SECONDS = 60
+PRODUCT_CACHE_PREFIX = "products:id:"
+PRODUCT_CACHE_TTL_SECONDS = 60
+
+_redis_client = None
+local_categories = TTLCache(maxsize=1, ttl=CATEGORIES_LOCAL_TTL_SECONDS)
+
+def get_redis() -> aioredis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(settings.redis_url)
+    return _redis_client
+
+def product_cache_key(product_id: int) -> str:
+    return f"{PRODUCT_CACHE_PREFIX}{product_id}"
+
+async def get_json(key: str) -> Optional[Any]:
+    """Return the cached value, or None on a miss or when Redis is unavailable"""
+    try:
+        cached = await get_redis().get(key)
+        if cached:
+            return orjson.loads(cached)
+    except Exception as e:
+        logger.debug(f"Cache read failed for {key}: {e}")
+    return None
+
+async def set_json(key: str, value: Any, ttl: int):
+    try:
+        await get_redis().set(key, orjson.dumps(value), ex=ttl)
+    except Exception as e:
+        logger.debug(f"Cache write failed for {key}: {e}")
+
+async def delete(*keys: str):
+    if not keys:
+        return
+    try:
+        await get_redis().delete(*keys)
+    except Exception as e:
+        logger.debug(f"Cache delete failed for {keys}: {e}")
@@ -1,9 +1,7 @@
-import sys, os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
 from database import DatabaseManager, Base
 from .config import settings
 
-db_manager = DatabaseManager(settings.database_url)
+db_manager = DatabaseManager(settings.database_url, application_name="product-service")
 
 async def get_db():
     async for session in db_manager.get_db():
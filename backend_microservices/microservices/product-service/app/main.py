@@ -1,22 +1,19 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routes import products
+from .routes import products, admin
 from .config import settings
 from .database import db_manager
-import sys
-import os
-
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
 
 from custom_logging import setup_logging
+from responses import ORJSONResponse
 from health_checks import HealthChecker, create_fastapi_health_endpoints
 from startup_validation import create_startup_event_handler
 
 app = FastAPI(
     title="Product Service",
     description="Product Catalog Management Service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Setup logging
@@ -60,4 +57,5 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(products.router, tags=["Products"])
\ No newline at end of file
+app.include_router(products.router, tags=["Products"])
+app.include_router(admin.router, prefix="/admin", tags=["Admin"])
\ No newline at end of file
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Numeric
 from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
 from ..database import Base
 
 class Category(Base):
@@ -22,4 +23,7 @@ class Product(Base):
     stock_quantity = Column(Integer, default=0)
     unit = Column(String(20))
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Loaded explicitly with selectinload; lazy="raise" turns a missed eager load into an error
+    category = relationship("Category", lazy="raise")
@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
+from pydantic import TypeAdapter
+from typing import List
+import orjson
+from ..database import get_db, db_manager
+from .. import cache
+from ..models.product import Product
+from ..schemas.product import ProductResponse, ProductBulkUpdate, ProductRestock
+
+from custom_logging import setup_logging
+
+logger = setup_logging("product-service-admin", log_level="INFO")
+
+router = APIRouter()
+
+PRODUCT_LIST = TypeAdapter(List[ProductResponse])
+# Rows fetched from the server-side cursor and encoded per streamed chunk
+PRODUCT_STREAM_BATCH = 500
+
+SELECT_ALL_PRODUCTS = select(Product).options(selectinload(Product.category)).order_by(Product.id)
+
+@router.get("/products")
+async def get_all_products(
+    stream: bool = Query(False, description="Return NDJSON, one product per line, as rows are read"),
+    db: AsyncSession = Depends(get_db)
+):
+    """List every product, including inactive ones"""
+    if not stream:
+        result = await db.execute(SELECT_ALL_PRODUCTS)
+        return PRODUCT_LIST.validate_python(result.scalars().all(), from_attributes=True)
+    
+    async def generate():
+        # The session lives inside the generator so it stays open while the body streams
+        async with db_manager.AsyncSessionLocal() as stream_db:
+            result = await stream_db.stream_scalars(
+                SELECT_ALL_PRODUCTS.execution_options(yield_per=PRODUCT_STREAM_BATCH)
+            )
+            async for partition in result.partitions():
+                rows = PRODUCT_LIST.dump_python(
+                    PRODUCT_LIST.validate_python(partition, from_attributes=True), mode="json"
+                )
+                yield b"".join(orjson.dumps(row) + b"\n" for row in rows)
+    
+    logger.info("Streaming admin product list")
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+@router.put("/products/bulk")
+async def bulk_update_products(
+    request: ProductBulkUpdate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Apply the same field updates to many products in one statement"""
+    update_dict = request.updates.model_dump(exclude_unset=True)
+    if not update_dict or not request.product_ids:
+        return {"updated": 0}
+    
+    result = await db.execute(
+        update(Product)
+        .where(Product.id.in_(request.product_ids))
+        .values(**update_dict)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    await cache.delete(*(cache.product_cache_key(product_id) for product_id in request.product_ids))
+    
+    logger.info(f"Bulk updated {result.rowcount} products: {sorted(update_dict)}")
+    return {"updated": result.rowcount}
+
+@router.post("/products/{product_id}/restock")
+async def restock_product(
+    product_id: int,
+    request: ProductRestock,
+    db: AsyncSession = Depends(get_db)
+):
+    """Add stock to a product in one atomic statement"""
+    # Incrementing in SQL avoids the lost update of a read-modify-write
+    result = await db.execute(
+        update(Product)
+        .where(Product.id == product_id)
+        .values(stock_quantity=Product.stock_quantity + request.quantity)
+        .returning(Product.id, Product.stock_quantity)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
+    await db.commit()
+    await cache.delete(cache.product_cache_key(product_id))
+    
+    logger.info(f"Restocked product {product_id} by {request.quantity} to {row.stock_quantity}")
+    return {
+        "product_id": row.id,
+        "old_stock": row.stock_quantity - request.quantity,
+        "new_stock": row.stock_quantity
+    }
@@ -1,34 +1,51 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
 from ..database import get_db
 from ..models.product import Product, Category
 from ..schemas.product import ProductResponse, CategoryResponse
-import sys
-import os
+from .. import cache
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 from custom_logging import setup_logging
+from responses import ORJSONResponse, orm_json_response, orm_to_dict
 
 logger = setup_logging("product-service", log_level="INFO")
 
 router = APIRouter()
 
-@router.get("/categories", response_model=List[CategoryResponse])
+# Built once at import; per-request values are bound as parameters
+ACTIVE_CATEGORIES = select(Category).where(Category.is_active == True)
+ACTIVE_PRODUCTS = select(Product).options(
+    selectinload(Product.category)
+).where(Product.is_active == True)
+SELECT_ACTIVE_PRODUCT = ACTIVE_PRODUCTS.where(Product.id == bindparam("product_id"))
+
+# Read routes return ready-made responses; the schemas only document them
+@router.get("/categories", response_model=None, responses={200: {"model": List[CategoryResponse]}})
 async def get_categories(db: AsyncSession = Depends(get_db)):
     """Get all active categories"""
+    cached = cache.local_categories.get(cache.CATEGORIES_CACHE_KEY)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    cached = await cache.get_json(cache.CATEGORIES_CACHE_KEY)
+    if cached is not None:
+        cache.local_categories[cache.CATEGORIES_CACHE_KEY] = cached
+        return ORJSONResponse(cached)
+    
     logger.info("Fetching all categories")
-    result = await db.execute(
-        select(Category).where(Category.is_active == True)
-    )
+    result = await db.execute(ACTIVE_CATEGORIES)
     categories = result.scalars().all()
     logger.info(f"Found {len(categories)} categories")
-    return [CategoryResponse.model_validate(cat) for cat in categories]
+    
+    response = [orm_to_dict(CategoryResponse, category) for category in categories]
+    await cache.set_json(cache.CATEGORIES_CACHE_KEY, response, cache.CATEGORIES_CACHE_TTL_SECONDS)
+    cache.local_categories[cache.CATEGORIES_CACHE_KEY] = response
+    return ORJSONResponse(response)
 
-@router.get("/", response_model=List[ProductResponse])
+@router.get("/", response_model=None, responses={200: {"model": List[ProductResponse]}})
 async def get_products(
     category_id: Optional[int] = Query(None, description="Filter by category ID"),
     search: Optional[str] = Query(None, description="Search products by name"),
@@ -39,14 +56,13 @@ async def get_products(
     """Get products with optional filtering and pagination"""
     logger.info(f"Fetching products - category_id: {category_id}, search: {search}, limit: {limit}, offset: {offset}")
     
-    query = select(Product).options(
-        selectinload(Product.category)
-    ).where(Product.is_active == True)
+    query = ACTIVE_PRODUCTS
     
     if category_id:
         query = query.where(Product.category_id == category_id)
     
     if search:
+        # Served by the idx_products_name_trgm trigram index despite the leading wildcard
         query = query.where(Product.name.ilike(f"%{search}%"))
     
     query = query.offset(offset).limit(limit)
@@ -54,24 +70,26 @@ async def get_products(
     result = await db.execute(query)
     products = result.scalars().all()
     logger.info(f"Found {len(products)} products")
-    return [ProductResponse.model_validate(product) for product in products]
+    return orm_json_response(ProductResponse, products)
 
-@router.get("/{product_id}", response_model=ProductResponse)
+@router.get("/{product_id}", response_model=None, responses={200: {"model": ProductResponse}})
 async def get_product(
     product_id: int,
     db: AsyncSession = Depends(get_db)
 ):
     """Get product by ID"""
+    cached = await cache.get_json(cache.product_cache_key(product_id))
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     logger.info(f"Fetching product with ID: {product_id}")
-    result = await db.execute(
-        select(Product).options(
-            selectinload(Product.category)
-        ).where(Product.id == product_id, Product.is_active == True)
-    )
+    result = await db.execute(SELECT_ACTIVE_PRODUCT, {"product_id": product_id})
     product = result.scalar_one_or_none()
     
     if not product:
         logger.warning(f"Product not found: {product_id}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
     
-    return ProductResponse.model_validate(product)
\ No newline at end of file
+    response = ProductResponse.model_validate(product).model_dump(mode="json")
+    await cache.set_json(cache.product_cache_key(product_id), response, cache.PRODUCT_CACHE_TTL_SECONDS)
+    return ORJSONResponse(response)
\ No newline at end of file
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional
 from datetime import datetime
 
 class CategoryResponse(BaseModel):
@@ -9,8 +9,7 @@ class CategoryResponse(BaseModel):
     image_url: Optional[str] = None
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ProductResponse(BaseModel):
     id: int
@@ -27,5 +26,22 @@ class ProductResponse(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class ProductUpdate(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    price: Optional[float] = None
+    mrp: Optional[float] = None
+    category_id: Optional[int] = None
+    image_url: Optional[str] = None
+    stock_quantity: Optional[int] = None
+    unit: Optional[str] = None
+    is_active: Optional[bool] = None
+
+class ProductBulkUpdate(BaseModel):
+    product_ids: List[int]
+    updates: ProductUpdate
+
+class ProductRestock(BaseModel):
+    quantity: int = Field(..., gt=0)
@@ -1,8 +1,5 @@
 from fastapi import HTTPException, status
 from typing import Optional, Dict, Any
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
 from http_client import ResilientHttpClient
 from custom_circuit_breaker import CircuitBreaker, RetryConfig, CircuitBreakerError
 import logging
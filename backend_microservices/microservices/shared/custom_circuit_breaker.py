@@ -39,14 +39,19 @@ class CircuitBreaker:
             time.time() - self.last_failure_time >= self.recovery_timeout
         )
     
-    def _on_success(self):
+    @property
+    def is_open(self) -> bool:
+        """True while calls should be rejected; the recovery timeout lets a trial call through"""
+        return self.state == CircuitState.OPEN and not self._should_attempt_reset()
+    
+    def record_success(self):
         """Reset circuit breaker on successful call"""
         self.failure_count = 0
         self.state = CircuitState.CLOSED
         logger.info(f"Circuit breaker {self.name} reset to CLOSED state")
     
-    def _on_failure(self):
-        """Handle failure and potentially open circuit"""
+    def record_failure(self):
+        """Count a failed call, opening the circuit once the threshold is reached"""
         self.failure_count += 1
         self.last_failure_time = time.time()
         
@@ -74,12 +79,12 @@ class CircuitBreaker:
                 result = func(*args, **kwargs)
             
             # Success - reset circuit breaker
-            self._on_success()
+            self.record_success()
             return result
             
         except self.expected_exception as e:
             # Expected failure - record it
-            self._on_failure()
+            self.record_failure()
             raise e
         except Exception as e:
             # Unexpected exception - don't count as failure
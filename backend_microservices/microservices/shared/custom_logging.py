@@ -1,26 +1,40 @@
 import logging
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, Any
-import json
-import uuid
+import atexit
+import orjson
+import itertools
+import queue
 import time
-from datetime import datetime
 from pathlib import Path
 
 class JSONFormatter(logging.Formatter):
     """Enhanced JSON formatter for structured logging"""
     
+    # The "YYYY-MM-DDTHH:MM:SS" part is rendered once per second; records within
+    # that second only append their microseconds
+    _timestamp_second = None
+    _timestamp_prefix = ""
+    
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._timestamp_prefix}.{int((created - second) * 1_000_000):06d}"
+    
     def format(self, record):
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
-            "process_id": os.getpid(),
+            "process_id": record.process,
             "thread_id": record.thread
         }
         
@@ -44,7 +58,27 @@ class JSONFormatter(logging.Formatter):
             if hasattr(record, field):
                 log_entry[field] = getattr(record, field)
         
-        return json.dumps(log_entry, default=str)
+        return orjson.dumps(log_entry, default=str).decode()
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler for an in-process queue; records are passed on as they are"""
+    
+    def prepare(self, record):
+        # The message is rendered now so later changes to its args cannot alter it;
+        # exc_info is kept so the JSON formatter can still structure exceptions
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+# One listener thread per configured service logger, stopped (and drained) at exit
+_listeners: Dict[str, QueueListener] = {}
+
+def _stop_listeners():
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
+atexit.register(_stop_listeners)
 
 def setup_logging(
     service_name: str,
@@ -77,7 +111,7 @@ def setup_logging(
     # Console handler (always enabled)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler with rotation
     if enable_file_logging:
@@ -104,7 +138,18 @@ def setup_logging(
         else:
             file_handler.setFormatter(console_formatter)
         
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Formatting and writes (including file rotation) happen on a listener thread,
+    # so logging from a request handler never blocks the event loop on I/O
+    previous_listener = _listeners.pop(service_name, None)
+    if previous_listener:
+        previous_listener.stop()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[service_name] = listener
+    logger.addHandler(_LocalQueueHandler(log_queue))
     
     # Add service name and correlation ID support to all log records
     old_factory = logging.getLogRecordFactory()
@@ -128,6 +173,15 @@ def setup_logging(
     
     return logger
 
+# Request IDs are a per-process random prefix plus a monotonic counter, which
+# avoids a urandom syscall and UUID formatting on every request
+_REQUEST_ID_PREFIX = os.urandom(4).hex()
+_REQUEST_ID_COUNTER = itertools.count()
+
+def generate_request_id() -> str:
+    """Generate a request ID unique across processes and restarts"""
+    return f"{_REQUEST_ID_PREFIX}-{time.time_ns():x}-{next(_REQUEST_ID_COUNTER):x}"
+
 # Context variable for correlation ID
 try:
     import contextvars
@@ -162,7 +216,7 @@ class RequestLoggingMiddleware:
             return
         
         # Generate request ID
-        request_id = str(uuid.uuid4())
+        request_id = generate_request_id()
         start_time = time.time()
         
         # Set correlation ID in context
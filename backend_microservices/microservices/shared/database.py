@@ -1,20 +1,36 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Typed declarative base; legacy Column() attributes keep working alongside Mapped[]"""
+    pass
+
+def asyncpg_url(database_url: str) -> str:
+    """Pin plain postgres URLs to asyncpg; they would otherwise load the blocking psycopg2 driver"""
+    for prefix in ("postgresql://", "postgres://"):
+        if database_url.startswith(prefix):
+            return "postgresql+asyncpg://" + database_url[len(prefix):]
+    return database_url
 
 class DatabaseManager:
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, application_name: str = "blinkit_microservice"):
+        # LIFO checkout keeps the most recently used connections warm and lets
+        # surplus ones sit idle until they are recycled
         self.engine = create_async_engine(
-            database_url,
+            asyncpg_url(database_url),
             echo=False,
             pool_pre_ping=True,
-            pool_recycle=300,
-            pool_size=5,
-            max_overflow=10,
+            pool_recycle=1800,
+            pool_size=20,
+            max_overflow=40,
+            pool_timeout=10,
+            pool_use_lifo=True,
+            # Room for every service's statements so none are recompiled after eviction
+            query_cache_size=1200,
             connect_args={
                 "server_settings": {
-                    "application_name": "blinkit_microservice"
+                    "application_name": application_name,
+                    "jit": "off"
                 }
             }
         )
@@ -28,5 +44,9 @@ class DatabaseManager:
         async with self.AsyncSessionLocal() as session:
             try:
                 yield session
+            except Exception:
+                # Roll back so the connection goes back to the pool clean
+                await session.rollback()
+                raise
             finally:
                 await session.close()
\ No newline at end of file
@@ -1,11 +1,15 @@
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
 import httpx
 import asyncio
 from datetime import datetime
 from typing import Dict, Any, List, Callable
 import psutil
 import os
+import time
+from responses import ORJSONResponse
+
+# Probes fire every few seconds; dependency results are reused for this long
+HEALTH_CACHE_TTL_SECONDS = 5
 
 class HealthChecker:
     """Comprehensive health checking system"""
@@ -15,6 +19,8 @@ class HealthChecker:
         self.logger = logger
         self.dependency_checks = {}
         self.checks = {}  # For backward compatibility
+        self._cached_health = None
+        self._cached_at = 0.0
     
     def register_dependency_check(self, name: str, check_func: Callable):
         """Register a dependency health check"""
@@ -100,7 +106,11 @@ class HealthChecker:
             return {"error": str(e)}
     
     async def get_comprehensive_health(self) -> Dict[str, Any]:
-        """Get comprehensive health status"""
+        """Get comprehensive health status, reusing the last result for a few seconds"""
+        now = time.monotonic()
+        if self._cached_health is not None and now - self._cached_at < HEALTH_CACHE_TTL_SECONDS:
+            return self._cached_health
+        
         health_data = {
             "service": self.service_name,
             "status": "healthy",
@@ -128,6 +138,8 @@ class HealthChecker:
             health_data["status"] = "degraded" if len(unhealthy_deps) < len(health_data["dependencies"]) else "unhealthy"
             health_data["unhealthy_dependencies"] = unhealthy_deps
         
+        self._cached_health = health_data
+        self._cached_at = now
         return health_data
     
     async def run_all_checks(self) -> Dict[str, Any]:
@@ -162,7 +174,7 @@ def create_fastapi_health_endpoints(app: FastAPI, health_checker: HealthChecker)
         """Detailed health check with dependencies"""
         health_data = await health_checker.get_comprehensive_health()
         status_code = 200 if health_data["status"] == "healthy" else 503
-        return JSONResponse(content=health_data, status_code=status_code)
+        return ORJSONResponse(content=health_data, status_code=status_code)
     
     @app.get("/health/ready")
     async def readiness_check():
@@ -171,7 +183,7 @@ def create_fastapi_health_endpoints(app: FastAPI, health_checker: HealthChecker)
         if health_data["status"] in ["healthy", "degraded"]:
             return {"status": "ready"}
         else:
-            return JSONResponse(content={"status": "not ready"}, status_code=503)
+            return ORJSONResponse(content={"status": "not ready"}, status_code=503)
     
     @app.get("/health/live")
     async def liveness_check():
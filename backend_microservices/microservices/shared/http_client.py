@@ -3,9 +3,6 @@ import asyncio
 import time
 from typing import Dict, Any, Optional, Union, List
 from enum import Enum
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
 from custom_circuit_breaker import CircuitBreaker, RetryConfig, CircuitBreakerError
 import logging
 import json
@@ -99,8 +96,27 @@ class ResilientHttpClient:
         self._error_count = 0
         self._last_success_time = None
         
+        # Pooled client, created on first request and reused so keep-alive
+        # connections survive between calls
+        self._client: Optional[httpx.AsyncClient] = None
+        
         logger.info(f"Initialized HTTP client for {service_name} at {base_url}")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self._client
+    
+    async def close(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _merge_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
         """Merge default headers with request-specific headers"""
         merged = self.default_headers.copy()
@@ -209,37 +225,37 @@ class ResilientHttpClient:
             try:
                 logger.debug(f"Attempt {attempt}/{self.retry_config.max_attempts} - {method} {full_url}")
                 
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.request(method, full_url, **kwargs)
+                client = self._get_client()
+                response = await client.request(method, full_url, **kwargs)
+                
+                # Check for HTTP errors
+                if response.status_code >= 400:
+                    error = self._classify_error(response=response)
                     
-                    # Check for HTTP errors
-                    if response.status_code >= 400:
-                        error = self._classify_error(response=response)
-                        
-                        if self._should_retry(error, attempt):
-                            last_error = error
-                            logger.warning(f"Retryable error on attempt {attempt}: {error}")
-                            
-                            if attempt < self.retry_config.max_attempts:
-                                delay = self.retry_config.get_delay(attempt)
-                                logger.debug(f"Waiting {delay}s before retry")
-                                await asyncio.sleep(delay)
-                                continue
+                    if self._should_retry(error, attempt):
+                        last_error = error
+                        logger.warning(f"Retryable error on attempt {attempt}: {error}")
                         
-                        # Non-retryable error or max attempts reached
-                        self._error_count += 1
-                        if self.circuit_breaker:
-                            self.circuit_breaker.record_failure()
-                        raise error
+                        if attempt < self.retry_config.max_attempts:
+                            delay = self.retry_config.get_delay(attempt)
+                            logger.debug(f"Waiting {delay}s before retry")
+                            await asyncio.sleep(delay)
+                            continue
                     
-                    # Success
-                    self._last_success_time = time.time()
+                    # Non-retryable error or max attempts reached
+                    self._error_count += 1
                     if self.circuit_breaker:
-                        self.circuit_breaker.record_success()
-                    
-                    logger.debug(f"Successful {method} request to {self.service_name}")
-                    return response
-                    
+                        self.circuit_breaker.record_failure()
+                    raise error
+                
+                # Success
+                self._last_success_time = time.time()
+                if self.circuit_breaker:
+                    self.circuit_breaker.record_success()
+                
+                logger.debug(f"Successful {method} request to {self.service_name}")
+                return response
+                
             except Exception as e:
                 error = self._classify_error(exception=e)
                 
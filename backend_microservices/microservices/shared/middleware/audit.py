@@ -1,10 +1,13 @@
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 import json
+import logging
 import time
 from ..services.audit_service import AuditService
 from ..models.audit import AuditEventType
 
+logger = logging.getLogger(__name__)
+
 class AuditMiddleware(BaseHTTPMiddleware):
     """Middleware to log all API requests for audit purposes"""
     
@@ -48,6 +51,6 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 )
         except Exception as e:
             # Don't break the request if audit logging fails
-            print(f"Audit logging failed: {str(e)}")
+            logger.warning(f"Audit logging failed: {str(e)}")
         
         return response
\ No newline at end of file
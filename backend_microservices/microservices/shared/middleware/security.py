@@ -1,37 +1,60 @@
 from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
 import time
 import logging
 from typing import Dict, Any
-import redis
+import redis.asyncio as aioredis
+from cachetools import TTLCache
 import os
+from custom_logging import generate_request_id, set_correlation_id
+from responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
+SECURITY_HEADERS = {
+    "X-Frame-Options": "DENY",
+    "X-Content-Type-Options": "nosniff",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Content-Security-Policy": (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+        "style-src 'self' 'unsafe-inline'; "
+        "img-src 'self' data: https:; "
+        "font-src 'self' https:; "
+        "connect-src 'self' https:; "
+        "frame-ancestors 'none';"
+    ),
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=(), payment=(), usb=()",
+    "Server": "GroFast-API"
+}
+
+NO_CACHE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, private",
+    "Pragma": "no-cache",
+    "Expires": "0"
+}
+
+SENSITIVE_PATH_PREFIXES = ("/auth/", "/admin/", "/orders/", "/cart/", "/delivery/", "/notifications/")
+
+RATE_LIMIT_EXEMPT_PATHS = {"/health", "/metrics"}
+
+# Each worker may hold back up to limit / (divisor * workers) requests per client
+# before flushing them to Redis
+LOCAL_BATCH_DIVISOR = 10
+
+def is_sensitive_endpoint(path: str) -> bool:
+    """Check if endpoint contains sensitive data"""
+    return path.startswith(SENSITIVE_PATH_PREFIXES)
+
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Enhanced security headers middleware with sensitive endpoint detection"""
     
     def __init__(self, app):
         super().__init__(app)
-        self.security_headers = {
-            "X-Frame-Options": "DENY",
-            "X-Content-Type-Options": "nosniff",
-            "X-XSS-Protection": "1; mode=block",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Content-Security-Policy": (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data: https:; "
-                "font-src 'self' https:; "
-                "connect-src 'self' https:; "
-                "frame-ancestors 'none';"
-            ),
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            "Permissions-Policy": "geolocation=(), microphone=(), camera=(), payment=(), usb=()",
-            "Server": "GroFast-API"
-        }
+        self.security_headers = SECURITY_HEADERS
     
     async def dispatch(self, request: Request, call_next):
         response = await call_next(request)
@@ -45,34 +68,87 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 response.headers[header_name] = header_value
         
         # Add cache control for sensitive endpoints
-        if self._is_sensitive_endpoint(request.url.path):
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, private"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+        if is_sensitive_endpoint(request.url.path):
+            response.headers.update(NO_CACHE_HEADERS)
         
         return response
-    
-    def _is_sensitive_endpoint(self, path: str) -> bool:
-        """Check if endpoint contains sensitive data"""
-        sensitive_patterns = ["/auth/", "/admin/", "/orders/", "/cart/", "/delivery/", "/notifications/"]
-        return any(path.startswith(pattern) for pattern in sensitive_patterns)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Enhanced rate limiting middleware with endpoint-specific limits"""
+class GatewayMiddleware:
+    """
+    Pure ASGI middleware combining request IDs, rate limiting and security headers
+    
+    Each BaseHTTPMiddleware layer wraps the downstream app in its own task group,
+    so the gateway runs these concerns in a single layer instead of stacking
+    SecurityHeadersMiddleware and a separate rate limiter.
+    """
     
     def __init__(self, app, requests_per_minute: int = 100):
-        super().__init__(app)
+        self.app = app
         self.requests_per_minute = requests_per_minute
-        self.redis_client = None
-        try:
-            self.redis_client = redis.Redis.from_url(os.getenv('REDIS_URL', 'redis://localhost:6379/0'))
-            self.redis_client.ping()
-            self.redis_available = True
-            logger.info("Redis connection established for rate limiting")
-        except Exception as e:
-            logger.warning(f"Redis unavailable for rate limiting: {e}")
-            self.redis_available = False
-            self.memory_store = {}
+        self.window_seconds = 60
+        # The asyncio client connects lazily, so Redis failures are handled per request
+        self.redis_client = aioredis.from_url(
+            os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+            max_connections=100,
+            decode_responses=True
+        )
+        self.memory_store = {}
+        # Per-client (unflushed requests, last Redis count) kept in-process
+        self.local_counts = TTLCache(maxsize=50_000, ttl=self.window_seconds)
+        self.worker_count = max(1, int(os.getenv('WEB_CONCURRENCY', '1')))
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
+        path = scope["path"]
+        request_id = generate_request_id()
+        set_correlation_id(request_id)
+        
+        extra_headers = {"X-Request-ID": request_id}
+        for header_name, header_value in SECURITY_HEADERS.items():
+            if header_name != "Strict-Transport-Security" or scope.get("scheme") == "https":
+                extra_headers[header_name] = header_value
+        if is_sensitive_endpoint(path):
+            extra_headers.update(NO_CACHE_HEADERS)
+        
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for header_name, header_value in extra_headers.items():
+                    headers[header_name] = header_value
+            await send(message)
+        
+        # Skip rate limiting for health checks
+        if path not in RATE_LIMIT_EXEMPT_PATHS:
+            identifier = self._get_client_identifier(request)
+            limit = self._get_endpoint_limit(path)
+            
+            # Count the request and check the limit in one step
+            current_count = await self._record_request(identifier, limit)
+            if current_count > limit:
+                response = ORJSONResponse(
+                    status_code=429,
+                    content={
+                        "detail": "Rate limit exceeded",
+                        "limit": limit,
+                        "retry_after": self.window_seconds
+                    },
+                    headers={
+                        "X-RateLimit-Limit": str(limit),
+                        "X-RateLimit-Remaining": "0",
+                        "Retry-After": str(self.window_seconds)
+                    }
+                )
+                await response(scope, receive, send_with_headers)
+                return
+            
+            extra_headers["X-RateLimit-Limit"] = str(limit)
+            extra_headers["X-RateLimit-Remaining"] = str(limit - current_count)
+        
+        await self.app(scope, receive, send_with_headers)
     
     def _get_client_identifier(self, request: Request) -> str:
         """Get client identifier for rate limiting"""
@@ -94,73 +170,38 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return 50  # Moderate for admin
         return self.requests_per_minute  # Default
     
-    async def dispatch(self, request: Request, call_next):
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/metrics"]:
-            return await call_next(request)
-        
-        identifier = self._get_client_identifier(request)
-        limit = self._get_endpoint_limit(request.url.path)
-        current_time = int(time.time())
-        window_start = current_time - 60
-        
-        # Check rate limit
-        if await self._is_rate_limited(identifier, current_time, window_start, limit):
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "detail": "Rate limit exceeded",
-                    "limit": limit,
-                    "retry_after": 60
-                },
-                headers={
-                    "X-RateLimit-Limit": str(limit),
-                    "X-RateLimit-Remaining": "0",
-                    "Retry-After": "60"
-                }
-            )
+    async def _record_request(self, identifier: str, limit: int) -> int:
+        """Record a request and return the request count for the current window"""
+        # Clients well under their limit are counted in-process and flushed to
+        # Redis in batches; anything near the limit is always checked in Redis
+        pending, last_count = self.local_counts.get(identifier, (0, 0))
+        pending += 1
+        batch_size = max(1, limit // (LOCAL_BATCH_DIVISOR * self.worker_count))
+        if pending < batch_size and last_count + pending <= limit:
+            self.local_counts[identifier] = (pending, last_count)
+            return last_count + pending
         
-        # Record request
-        await self._record_request(identifier, current_time)
-        
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(limit)
-        return response
-    
-    async def _is_rate_limited(self, identifier: str, current_time: int, window_start: int, limit: int) -> bool:
-        if self.redis_available:
-            try:
-                key = f"rate_limit:{identifier}"
-                pipe = self.redis_client.pipeline()
-                pipe.zremrangebyscore(key, 0, window_start)
-                pipe.zcard(key)
-                pipe.expire(key, 60)
-                results = pipe.execute()
-                return results[1] >= limit
-            except:
-                pass
+        try:
+            key = f"rate_limit:{identifier}"
+            # INCRBY returns the new count and EXPIRE NX only sets the TTL on the
+            # first hit of the window, so a flush costs a single round-trip
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.incrby(key, pending)
+                pipe.expire(key, self.window_seconds, nx=True)
+                current_count, _ = await pipe.execute()
+            self.local_counts[identifier] = (0, current_count)
+            return current_count
+        except Exception as e:
+            logger.debug(f"Redis unavailable for rate limiting, using memory store: {e}")
         
         # Fallback to memory
-        if identifier not in self.memory_store:
-            self.memory_store[identifier] = []
-        
-        self.memory_store[identifier] = [
-            req_time for req_time in self.memory_store[identifier] 
+        current_time = time.time()
+        window_start = current_time - self.window_seconds
+        requests = [
+            req_time for req_time in self.memory_store.get(identifier, [])
             if req_time > window_start
         ]
-        
-        return len(self.memory_store[identifier]) >= limit
-    
-    async def _record_request(self, identifier: str, current_time: int):
-        if self.redis_available:
-            try:
-                key = f"rate_limit:{identifier}"
-                self.redis_client.zadd(key, {str(current_time): current_time})
-                return
-            except:
-                pass
-        
-        # Fallback to memory
-        if identifier not in self.memory_store:
-            self.memory_store[identifier] = []
-        self.memory_store[identifier].append(current_time)
\ No newline at end of file
+        requests.extend([current_time] * pending)
+        self.memory_store[identifier] = requests
+        self.local_counts[identifier] = (0, len(requests))
+        return len(requests)
@@ -30,7 +30,7 @@ class RiskLevel(enum.Enum):
 class AuditLog(Base):
     __tablename__ = "audit_logs"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     event_type = Column(Enum(AuditEventType), nullable=False, index=True)
     user_id = Column(Integer, index=True)
     session_id = Column(String(255))
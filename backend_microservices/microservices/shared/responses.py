@@ -0,0 +1,69 @@
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, get_args, get_origin
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+import orjson
+
+def orjson_default(obj: Any) -> Any:
+    """Fallback serializer for types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return str(obj)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Find the response model inside Optional[...] / List[...] annotations"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        nested = _nested_model(arg)
+        if nested is not None:
+            return nested
+    return None
+
+@lru_cache(maxsize=None)
+def _field_plan(model_cls: Type[BaseModel]) -> Tuple[Tuple[str, Optional[Type[BaseModel]], bool, Any], ...]:
+    """Per-model (field, nested model, is list, default) tuples, introspected once per class"""
+    return tuple(
+        (
+            name,
+            _nested_model(field.annotation),
+            get_origin(field.annotation) is list,
+            None if field.is_required() else field.get_default(call_default_factory=True)
+        )
+        for name, field in model_cls.model_fields.items()
+    )
+
+def orm_to_dict(model_cls: Type[BaseModel], obj: Any) -> Dict[str, Any]:
+    """Pick a response model's fields off a trusted ORM row without running pydantic
+
+    The response model only describes the shape; attributes the row does not
+    have fall back to the model defaults. Decimals, enums and datetimes are
+    left for ORJSONResponse to render.
+    """
+    values = {}
+    for name, nested, is_list, default in _field_plan(model_cls):
+        value = getattr(obj, name, default)
+        if nested is not None and value is not None:
+            if is_list:
+                value = [orm_to_dict(nested, child) for child in value]
+            else:
+                value = orm_to_dict(nested, value)
+        values[name] = value
+    return values
+
+def orm_json_response(model_cls: Type[BaseModel], rows: Any) -> ORJSONResponse:
+    """Render trusted ORM rows with orjson, keeping pydantic off the list read path
+
+    Returning a Response skips FastAPI's response_model validation, while
+    response_model still documents the route.
+    """
+    return ORJSONResponse([orm_to_dict(model_cls, row) for row in rows])
@@ -20,23 +20,29 @@ class AuditService:
     
     RISK_PATTERNS = {
         RiskLevel.CRITICAL: [
-            r'(?i)(drop|delete|truncate)\s+table',
-            r'(?i)union\s+select',
-            r'(?i)<script[^>]*>.*?</script>',
-            r'(?i)javascript:',
+            r'(drop|delete|truncate)\s+table',
+            r'union\s+select',
+            r'<script[^>]*>.*?</script>',
+            r'javascript:',
         ],
         RiskLevel.HIGH: [
-            r'(?i)(select|insert|update|delete)\s+.*\s+(from|into|set)',
-            r'(?i)exec\s*\(',
-            r'(?i)eval\s*\(',
+            r'(select|insert|update|delete)\s+.*\s+(from|into|set)',
+            r'exec\s*\(',
+            r'eval\s*\(',
         ],
         RiskLevel.MEDIUM: [
-            r'(?i)(admin|root|administrator)',
-            r'(?i)(../|..\\)',
-            r'(?i)file://',
+            r'(admin|root|administrator)',
+            r'(../|..\\)',
+            r'file://',
         ]
     }
     
+    # Each level's patterns compiled once into a single alternation
+    RISK_REGEXES = {
+        level: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+        for level, patterns in RISK_PATTERNS.items()
+    }
+    
     @staticmethod
     def sanitize_data(data: Any) -> Any:
         """Remove sensitive information from data"""
@@ -63,20 +69,10 @@ class AuditService:
         """Calculate risk level based on request/response content"""
         combined_data = f"{request_data} {response_data}".lower()
         
-        # Check for critical patterns
-        for pattern in AuditService.RISK_PATTERNS[RiskLevel.CRITICAL]:
-            if re.search(pattern, combined_data):
-                return RiskLevel.CRITICAL
-        
-        # Check for high risk patterns
-        for pattern in AuditService.RISK_PATTERNS[RiskLevel.HIGH]:
-            if re.search(pattern, combined_data):
-                return RiskLevel.HIGH
-        
-        # Check for medium risk patterns
-        for pattern in AuditService.RISK_PATTERNS[RiskLevel.MEDIUM]:
-            if re.search(pattern, combined_data):
-                return RiskLevel.MEDIUM
+        # Check patterns from the most to the least severe level
+        for level in (RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM):
+            if AuditService.RISK_REGEXES[level].search(combined_data):
+                return level
         
         # Event-based risk assessment
         high_risk_events = {
@@ -135,7 +131,7 @@ class AuditService:
             
             # Alert on high-risk events
             if risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
-                await AuditService._send_security_alert(audit_log)
+                AuditService._send_security_alert(audit_log)
                 
         except Exception as e:
             # Don't let audit logging break the main application
@@ -146,7 +142,7 @@ class AuditService:
                 pass
     
     @staticmethod
-    async def _send_security_alert(audit_log: AuditLog):
+    def _send_security_alert(audit_log: AuditLog):
         """Send alert for high-risk security events"""
         # In production, integrate with alerting system (email, Slack, etc.)
         logger.critical(f"SECURITY ALERT: {audit_log.event_type} - Risk: {audit_log.risk_level}")
@@ -3,8 +3,11 @@ import os
 from typing import Optional
 import asyncio
 import aiofiles
+import logging
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 class R2StorageService:
     def __init__(self, endpoint_url: str, access_key: str, secret_key: str, bucket_name: str):
         self.bucket_name = bucket_name
@@ -22,7 +25,7 @@ class R2StorageService:
             self.s3_client.upload_file(file_path, self.bucket_name, object_key)
             return True
         except ClientError as e:
-            print(f"Error uploading file: {e}")
+            logger.error(f"Error uploading file: {e}")
             return False
     
     def generate_presigned_url(self, object_key: str, expiration: int = 3600) -> Optional[str]:
@@ -35,7 +38,7 @@ class R2StorageService:
             )
             return url
         except ClientError as e:
-            print(f"Error generating presigned URL: {e}")
+            logger.error(f"Error generating presigned URL: {e}")
             return None
     
     def get_public_url(self, object_key: str, custom_domain: Optional[str] = None) -> str:
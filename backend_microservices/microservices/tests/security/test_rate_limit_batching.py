@@ -0,0 +1,135 @@
+import pytest
+from fastapi.testclient import TestClient
+import sys
+import os
+
+# Add shared modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared'))
+
+from middleware.security import GatewayMiddleware
+from fastapi import FastAPI
+
+class FakePipeline:
+    """Records the INCRBY/EXPIRE pair a flush queues and applies it on execute"""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.increments = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def incrby(self, key, amount):
+        self.increments.append((key, amount))
+    
+    def expire(self, key, seconds, nx=False):
+        pass
+    
+    async def execute(self):
+        if self.redis.down:
+            raise ConnectionError("Redis is down")
+        self.redis.flushes.append(self.increments)
+        results = []
+        for key, amount in self.increments:
+            self.redis.counts[key] = self.redis.counts.get(key, 0) + amount
+            results.extend([self.redis.counts[key], True])
+        return results
+
+class FakeRedis:
+    def __init__(self):
+        self.counts = {}
+        self.flushes = []
+        self.down = False
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """Limiter for a single worker, so a limit of 100 flushes every 10 requests"""
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    middleware = GatewayMiddleware(app=None, requests_per_minute=100)
+    middleware.redis_client = FakeRedis()
+    return middleware
+
+async def record(limiter, times, identifier="ip:1", limit=100):
+    return [await limiter._record_request(identifier, limit) for _ in range(times)]
+
+@pytest.mark.asyncio
+async def test_client_under_limit_is_counted_locally_then_flushed(limiter):
+    """Requests below the batch size stay in-process; the batch is flushed as one INCRBY"""
+    counts = await record(limiter, 9)
+    
+    assert counts == list(range(1, 10))
+    assert limiter.redis_client.flushes == []
+    
+    assert await limiter._record_request("ip:1", 100) == 10
+    assert limiter.redis_client.flushes == [[("rate_limit:ip:1", 10)]]
+    # The flushed count is carried over for the next local batch
+    assert await limiter._record_request("ip:1", 100) == 11
+
+@pytest.mark.asyncio
+async def test_batch_size_is_split_across_workers(monkeypatch):
+    """Each of five workers may hold back only limit / (10 * 5) requests"""
+    monkeypatch.setenv("WEB_CONCURRENCY", "5")
+    limiter = GatewayMiddleware(app=None, requests_per_minute=100)
+    limiter.redis_client = FakeRedis()
+    
+    await record(limiter, 6)
+    
+    assert limiter.redis_client.flushes == [[("rate_limit:ip:1", 2)]] * 3
+
+@pytest.mark.asyncio
+async def test_client_crossing_limit_is_flushed_before_exceeding_it(limiter):
+    """Near the limit the local count forces a Redis flush, which sees other workers' requests"""
+    # Other workers have already sent 85 requests this window
+    limiter.redis_client.counts["rate_limit:ip:1"] = 85
+    
+    assert (await record(limiter, 10))[-1] == 95
+    
+    # 95 + 5 stays within the limit locally; the sixth request would cross it
+    assert await record(limiter, 5) == [96, 97, 98, 99, 100]
+    assert len(limiter.redis_client.flushes) == 1
+    
+    assert await limiter._record_request("ip:1", 100) == 101
+    assert limiter.redis_client.flushes[-1] == [("rate_limit:ip:1", 6)]
+    
+    # Once over the limit, every request is checked in Redis
+    assert await limiter._record_request("ip:1", 100) == 102
+    assert len(limiter.redis_client.flushes) == 3
+
+@pytest.mark.asyncio
+async def test_redis_down_replays_pending_into_memory_store(limiter):
+    """A failed flush counts the whole unflushed batch in the in-memory fallback"""
+    limiter.redis_client.down = True
+    
+    counts = await record(limiter, 10)
+    
+    assert counts == list(range(1, 11))
+    assert len(limiter.memory_store["ip:1"]) == 10
+    assert await limiter._record_request("ip:1", 100) == 11
+
+def test_requests_over_limit_get_429():
+    """The middleware answers 429 with rate limit headers once the count passes the limit"""
+    app = FastAPI()
+    
+    @app.get("/test")
+    async def test_endpoint():
+        return {"message": "test"}
+    
+    middleware = GatewayMiddleware(app, requests_per_minute=2)
+    middleware.redis_client = FakeRedis()
+    client = TestClient(middleware)
+    
+    assert [client.get("/test").status_code for _ in range(2)] == [200, 200]
+    response = client.get("/test")
+    
+    assert response.status_code == 429
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+    assert response.headers["Retry-After"] == "60"
+
+if __name__ == "__main__":
+    pytest.main([__file__])
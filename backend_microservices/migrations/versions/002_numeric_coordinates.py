@@ -0,0 +1,73 @@
+"""Store coordinates as floats and narrow FCM token columns
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+COORDINATE_COLUMNS = [
+    ('users', 'latitude'),
+    ('users', 'longitude'),
+    ('delivery_partners', 'current_latitude'),
+    ('delivery_partners', 'current_longitude'),
+    ('orders', 'delivery_latitude'),
+    ('orders', 'delivery_longitude'),
+]
+
+
+def upgrade() -> None:
+    for table_name, column_name in COORDINATE_COLUMNS:
+        op.alter_column(
+            table_name, column_name,
+            existing_type=sa.String(length=20),
+            type_=sa.Float(),
+            existing_nullable=True,
+            postgresql_using=f"NULLIF({column_name}, '')::double precision"
+        )
+
+    op.alter_column('users', 'fcm_token',
+        existing_type=sa.Text(),
+        type_=sa.String(length=256),
+        existing_nullable=True
+    )
+    op.alter_column('delivery_partners', 'fcm_token',
+        existing_type=sa.String(length=500),
+        type_=sa.String(length=256),
+        existing_nullable=True
+    )
+
+    op.create_index('idx_dp_status_location', 'delivery_partners',
+        ['status', 'current_latitude', 'current_longitude'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_dp_status_location', table_name='delivery_partners')
+
+    op.alter_column('delivery_partners', 'fcm_token',
+        existing_type=sa.String(length=256),
+        type_=sa.String(length=500),
+        existing_nullable=True
+    )
+    op.alter_column('users', 'fcm_token',
+        existing_type=sa.String(length=256),
+        type_=sa.Text(),
+        existing_nullable=True
+    )
+
+    for table_name, column_name in COORDINATE_COLUMNS:
+        op.alter_column(
+            table_name, column_name,
+            existing_type=sa.Float(),
+            type_=sa.String(length=20),
+            existing_nullable=True,
+            postgresql_using=f"{column_name}::varchar(20)"
+        )
@@ -0,0 +1,49 @@
+"""Index foreign keys and lookup paths, drop redundant primary key indexes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+# Primary keys already carry a unique index
+REDUNDANT_PK_INDEXES = [
+    'categories',
+    'users',
+    'delivery_partners',
+    'products',
+    'carts',
+    'orders',
+    'cart_items',
+    'delivery_locations',
+    'order_items',
+]
+
+
+def upgrade() -> None:
+    op.create_index('idx_orderitem_order', 'order_items', ['order_id'], unique=False)
+    op.create_index('idx_orderitem_product', 'order_items', ['product_id'], unique=False)
+    op.create_index('idx_dp_firebase_uid_active', 'delivery_partners', ['firebase_uid', 'is_active'], unique=False)
+    op.create_index('idx_dl_partner_timestamp', 'delivery_locations',
+        ['delivery_partner_id', sa.text('timestamp DESC')], unique=False)
+
+    for table_name in REDUNDANT_PK_INDEXES:
+        op.drop_index(op.f(f'ix_{table_name}_id'), table_name=table_name)
+
+
+def downgrade() -> None:
+    for table_name in REDUNDANT_PK_INDEXES:
+        op.create_index(op.f(f'ix_{table_name}_id'), table_name, ['id'], unique=False)
+
+    op.drop_index('idx_dl_partner_timestamp', table_name='delivery_locations')
+    op.drop_index('idx_dp_firebase_uid_active', table_name='delivery_partners')
+    op.drop_index('idx_orderitem_product', table_name='order_items')
+    op.drop_index('idx_orderitem_order', table_name='order_items')
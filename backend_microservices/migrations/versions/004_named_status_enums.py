@@ -0,0 +1,35 @@
+"""Rename status enum types and store lowercase enum values
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+STATUS_ENUMS = {
+    ('orderstatus', 'order_status'): [
+        'PENDING', 'CONFIRMED', 'PREPARING', 'OUT_FOR_DELIVERY', 'DELIVERED', 'CANCELLED'
+    ],
+    ('deliverystatus', 'delivery_status'): ['AVAILABLE', 'BUSY', 'OFFLINE'],
+}
+
+
+def upgrade() -> None:
+    for (old_name, new_name), labels in STATUS_ENUMS.items():
+        op.execute(f"ALTER TYPE {old_name} RENAME TO {new_name}")
+        for label in labels:
+            op.execute(f"ALTER TYPE {new_name} RENAME VALUE '{label}' TO '{label.lower()}'")
+
+
+def downgrade() -> None:
+    for (old_name, new_name), labels in STATUS_ENUMS.items():
+        for label in labels:
+            op.execute(f"ALTER TYPE {new_name} RENAME VALUE '{label.lower()}' TO '{label}'")
+        op.execute(f"ALTER TYPE {new_name} RENAME TO {old_name}")
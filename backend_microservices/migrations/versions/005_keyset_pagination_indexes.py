@@ -0,0 +1,27 @@
+"""Add (created_at, id) indexes for keyset pagination of admin lists
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_orders_created_id', 'orders',
+        [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('idx_users_created_id', 'users',
+        [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_users_created_id', table_name='users')
+    op.drop_index('idx_orders_created_id', table_name='orders')
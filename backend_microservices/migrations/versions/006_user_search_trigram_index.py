@@ -0,0 +1,27 @@
+"""Add trigram index for admin user search
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 14:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Expression must match USER_SEARCH_TEXT in auth-service routes/admin.py
+    op.execute(
+        "CREATE INDEX idx_users_search_trgm ON users USING gin "
+        "((coalesce(name, '') || ' ' || coalesce(email, '') || ' ' || coalesce(phone, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_users_search_trgm', table_name='users')
@@ -0,0 +1,45 @@
+"""Add materialized views for dashboard product and revenue analytics
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_top_products_30d AS
+        SELECT oi.product_id,
+               SUM(oi.quantity) AS quantity_sold,
+               SUM(oi.quantity * oi.price) AS revenue
+        FROM order_items oi
+        JOIN orders o ON o.id = oi.order_id
+        WHERE o.created_at >= now() - interval '30 days'
+          AND o.status <> 'cancelled'
+        GROUP BY oi.product_id
+    """)
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_daily_revenue_30d AS
+        SELECT date_trunc('day', created_at)::date AS day,
+               COUNT(*) AS orders,
+               COALESCE(SUM(total_amount) FILTER (WHERE status = 'delivered'), 0) AS revenue
+        FROM orders
+        WHERE created_at >= now() - interval '30 days'
+        GROUP BY 1
+    """)
+    # REFRESH ... CONCURRENTLY requires a unique index on each view
+    op.create_index('idx_mv_top_products_30d_product', 'mv_top_products_30d', ['product_id'], unique=True)
+    op.create_index('idx_mv_daily_revenue_30d_day', 'mv_daily_revenue_30d', ['day'], unique=True)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_daily_revenue_30d")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_top_products_30d")
@@ -0,0 +1,24 @@
+"""Add (user_id, created_at, id) index for keyset pagination of order history
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_orders_user_created_id', 'orders',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_orders_user_created_id', table_name='orders')
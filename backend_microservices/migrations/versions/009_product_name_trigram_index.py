@@ -0,0 +1,24 @@
+"""Add trigram index for product name search
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 16:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Serves the name ILIKE '%...%' filter in product-service get_products
+    op.execute("CREATE INDEX idx_products_name_trgm ON products USING gin (name gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.drop_index('idx_products_name_trgm', table_name='products')
@@ -59,7 +59,7 @@ def main():
     print("\n📋 Next steps:")
     print("1. Edit .env file with your Firebase, Supabase, and other credentials")
     print("2. Run: python run_dev.py (for development)")
-    print("3. Run: celery -A app.celery_tasks worker --loglevel=info (in another terminal)")
+    print("3. Run: celery -A celery_worker worker --pool=gevent --concurrency=200 --loglevel=info (in another terminal)")
     print("4. Visit: http://localhost:8000/docs for API documentation")
     print("\n🔗 Useful URLs:")
     print("- API Docs: http://localhost:8000/docs")
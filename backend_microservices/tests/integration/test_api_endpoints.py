@@ -222,17 +222,41 @@ class TestAPIEndpoints:
         assert isinstance(data, list)
         assert len(data) >= 0
     
+    @pytest.fixture
+    def admin_key(self):
+        """Admin key the gateway under test is configured with"""
+        from app.config import settings
+        return settings.admin_api_key
+    
     @pytest.mark.asyncio
-    async def test_admin_stats_endpoint(self, async_client):
+    async def test_admin_stats_endpoint(self, async_client, admin_key):
         """Test admin stats endpoint"""
         # Act
-        response = await async_client.get("/admin/stats", params={"admin_key": "admin123"})
+        response = await async_client.get("/admin/stats", params={"admin_key": admin_key})
         
         # Assert
         assert response.status_code == 200
         data = response.json()
         assert "total_users" in data or "message" in data
     
+    @pytest.mark.asyncio
+    async def test_admin_stats_wrong_key_401(self, async_client, admin_key):
+        """Test admin stats endpoint rejects a wrong admin key"""
+        # Act
+        response = await async_client.get("/admin/stats", params={"admin_key": admin_key + "x"})
+        
+        # Assert
+        assert response.status_code == 401
+    
+    @pytest.mark.asyncio
+    async def test_admin_stats_missing_key_422(self, async_client):
+        """Test admin stats endpoint requires an admin key"""
+        # Act
+        response = await async_client.get("/admin/stats")
+        
+        # Assert
+        assert response.status_code == 422
+    
     @pytest.mark.asyncio
     async def test_invalid_endpoint_404(self, async_client):
         """Test invalid endpoint returns 404"""
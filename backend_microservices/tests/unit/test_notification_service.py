@@ -86,40 +86,36 @@ class TestNotificationService:
         mock_smtp_send.assert_called_once()
     
     @pytest.mark.asyncio
-    @patch('twilio.rest.Client')
-    async def test_send_sms_notification_success(self, mock_twilio_client, notification_service):
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_send_sms_notification_success(self, mock_http_post, notification_service):
         """Test successful SMS notification sending"""
         # Arrange
         phone = "+1234567890"
         message = "This is a test SMS"
-        mock_client_instance = Mock()
-        mock_twilio_client.return_value = mock_client_instance
-        mock_client_instance.messages.create.return_value = Mock(sid="SMS123")
+        mock_http_post.return_value = Mock(status_code=201)
         
         # Act
         result = await notification_service.send_sms_notification(phone, message)
         
         # Assert
         assert result is True
-        mock_client_instance.messages.create.assert_called_once()
+        mock_http_post.assert_called_once()
     
     @pytest.mark.asyncio
-    @patch('twilio.rest.Client')
-    async def test_send_sms_notification_failure(self, mock_twilio_client, notification_service):
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_send_sms_notification_failure(self, mock_http_post, notification_service):
         """Test SMS notification sending failure"""
         # Arrange
         phone = "+invalid"
         message = "This is a test SMS"
-        mock_client_instance = Mock()
-        mock_twilio_client.return_value = mock_client_instance
-        mock_client_instance.messages.create.side_effect = Exception("Invalid phone number")
+        mock_http_post.return_value = Mock(status_code=400)
         
         # Act
         result = await notification_service.send_sms_notification(phone, message)
         
         # Assert
         assert result is False
-        mock_client_instance.messages.create.assert_called_once()
+        mock_http_post.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_notify_order_status_change(self, notification_service, mock_database):